@@ -2,40 +2,88 @@
 """
 Money Pot End-to-End Application
 Integrates with the verifier service for complete pot creation and hunting flow
+
+The Aptos SDK, aiohttp and cryptography are imported where they are first
+needed, so read-only callers (see cli.py) never pay for them.
 """
 
+from __future__ import annotations
+
 import asyncio
+import hashlib
+import importlib
 import json
 import os
+import random
+import struct
 import sys
-from typing import Optional, Dict, Any
-import aiohttp
-from dotenv import load_dotenv
-import base64
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, NamedTuple, Union
+
+from limiter import OVERLOAD_STATUSES, parse_retry_after, upstream_slot
+from metrics import metrics
+
+if TYPE_CHECKING:
+    import aiohttp
+    from aptos_sdk.account import Account
+    from aptos_sdk.account_address import AccountAddress
+    from aptos_sdk.async_client import RestClient as AsyncRestClient
+    from aptos_sdk.transactions import TransactionPayload
+
+# SDK names other modules import from here, resolved on first access
+_LAZY_IMPORTS = {
+    "Account": ("aptos_sdk.account", "Account"),
+    "AccountAddress": ("aptos_sdk.account_address", "AccountAddress"),
+    "ApiError": ("aptos_sdk.async_client", "ApiError"),
+    "AsyncRestClient": ("aptos_sdk.async_client", "RestClient"),
+    "Serializer": ("aptos_sdk.bcs", "Serializer"),
+    "EntryFunction": ("aptos_sdk.transactions", "EntryFunction"),
+    "TransactionArgument": ("aptos_sdk.transactions", "TransactionArgument"),
+    "TransactionPayload": ("aptos_sdk.transactions", "TransactionPayload"),
+    "SignedTransaction": ("aptos_sdk.transactions", "SignedTransaction"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def _load_env_file():
+    """Load the nearest .env at or above this file, as load_dotenv() would
+
+    python-dotenv is only imported when there is a file to load.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            from dotenv import load_dotenv
+            load_dotenv(path)
+            return
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return
+        directory = parent
+
 
 # Load environment variables
-load_dotenv()
-
-# Aptos SDK imports
-from aptos_sdk.account import Account
-from aptos_sdk.async_client import RestClient as AsyncRestClient
-from aptos_sdk.bcs import Serializer
-from aptos_sdk.transactions import (
-    EntryFunction,
-    TransactionArgument,
-    TransactionPayload,
-    SignedTransaction,
-)
-from aptos_sdk.account_address import AccountAddress
+_load_env_file()
 
 # Configuration
 MONEY_AUTH_URL = os.getenv("MONEY_AUTH_URL","https://auth.money-pot.unreal.art/")
 NODE_URL = os.getenv("RPC_URL", "https://fullnode.testnet.aptoslabs.com/v1")
+NODE_URLS = [url.strip() for url in os.getenv("RPC_URLS", "").split(",") if url.strip()] or [NODE_URL]
 MODULE_ADDR = os.getenv("MONEY_POT_ADDRESS", "0xea89ef9798a210009339ea6105c2008d8e154f8b5ae1807911c86320ea03ff3f")
 MODULE_QN = f"{MODULE_ADDR}::money_pot_manager"
+POT_EVENT_TYPE = f"{MODULE_QN}::PotEvent"
 
 
 def load_main_account_from_env() -> Account:
@@ -43,6 +91,7 @@ def load_main_account_from_env() -> Account:
     private_key = os.getenv("APTOS_PRIVATE_KEY")
     if not private_key:
         raise RuntimeError("APTOS_PRIVATE_KEY is not set")
+    from aptos_sdk.account import Account
     return Account.load_key(private_key)
 
 
@@ -51,26 +100,45 @@ def load_hunter_account_from_env() -> Account:
     private_key = os.getenv("HUNTER_PRIVATE_KEY")
     if not private_key:
         raise RuntimeError("HUNTER_PRIVATE_KEY is not set")
+    from aptos_sdk.account import Account
     return Account.load_key(private_key)
 
 
-async def create_account(client: AsyncRestClient, creator: Account, new_account: Account) -> str:
-    """Create a new account"""
+def load_oracle_account_from_env() -> Account:
+    """Load verifier oracle account from ORACLE_PRIVATE_KEY environment variable"""
+    private_key = os.getenv("ORACLE_PRIVATE_KEY")
+    if not private_key:
+        raise RuntimeError("ORACLE_PRIVATE_KEY is not set")
+    from aptos_sdk.account import Account
+    return Account.load_key(private_key)
+
+
+def create_account_payload(address: AccountAddress) -> TransactionPayload:
+    """Build the aptos_account::create_account payload"""
+    from aptos_sdk.transactions import EntryFunction, TransactionArgument, TransactionPayload
+    
     entry = EntryFunction.natural(
         "0x1::aptos_account",
         "create_account",
         [],
         [
-            TransactionArgument(new_account.account_address, lambda s, addr: addr.serialize(s)),
+            TransactionArgument(address, lambda s, addr: addr.serialize(s)),
         ],
     )
-    
-    payload = TransactionPayload(entry)
+    return TransactionPayload(entry)
+
+
+async def create_account(client: AsyncRestClient, creator: Account, new_account: Account) -> str:
+    """Create a new account"""
+    payload = create_account_payload(new_account.account_address)
     return await submit_transaction(client, creator, payload)
 
 
-async def fund_account(client: AsyncRestClient, sender: Account, receiver: AccountAddress, amount: int) -> str:
-    """Fund an account with APT tokens"""
+def fund_account_payload(receiver: AccountAddress, amount: int) -> TransactionPayload:
+    """Build the aptos_account::transfer payload"""
+    from aptos_sdk.bcs import Serializer
+    from aptos_sdk.transactions import EntryFunction, TransactionArgument, TransactionPayload
+    
     entry = EntryFunction.natural(
         "0x1::aptos_account",
         "transfer",
@@ -80,89 +148,414 @@ async def fund_account(client: AsyncRestClient, sender: Account, receiver: Accou
             TransactionArgument(amount, Serializer.u64),
         ],
     )
-    
-    payload = TransactionPayload(entry)
+    return TransactionPayload(entry)
+
+
+async def fund_account(client: AsyncRestClient, sender: Account, receiver: AccountAddress, amount: int) -> str:
+    """Fund an account with APT tokens"""
+    payload = fund_account_payload(receiver, amount)
     return await submit_transaction(client, sender, payload)
 
 
-async def fund_fungible_asset(client: AsyncRestClient, sender: Account, receiver: AccountAddress, token_address: str, amount: int) -> str:
-    """Fund an account with fungible assets"""
-    from aptos_sdk.transactions import TypeTag, StructTag
-    
-    token_addr = AccountAddress.from_str(token_address)
-    
-    # Create the type argument for the fungible asset
-    type_arg = TypeTag(StructTag(
-        AccountAddress.from_str("0x1"),
-        "fungible_asset",
-        "FungibleAsset",
-        [TypeTag(StructTag(token_addr, "", "", []))]
-    ))
+_fungible_asset_metadata_type_tag = None
+
+
+def fungible_asset_metadata_type_tag():
+    """The 0x1::fungible_asset::Metadata type argument, built once"""
+    global _fungible_asset_metadata_type_tag
+    if _fungible_asset_metadata_type_tag is None:
+        from aptos_sdk.account_address import AccountAddress
+        from aptos_sdk.transactions import StructTag, TypeTag
+        
+        _fungible_asset_metadata_type_tag = TypeTag(StructTag(
+            AccountAddress.from_str("0x1"), "fungible_asset", "Metadata", []
+        ))
+    return _fungible_asset_metadata_type_tag
+
+
+def fund_fungible_asset_payload(receiver: AccountAddress, token_address: str, amount: int) -> TransactionPayload:
+    """Build the primary_fungible_store::transfer<Metadata>(metadata, recipient, amount) payload"""
+    from aptos_sdk.account_address import AccountAddress
+    from aptos_sdk.bcs import Serializer
+    from aptos_sdk.transactions import EntryFunction, TransactionArgument, TransactionPayload
     
     entry = EntryFunction.natural(
         "0x1::primary_fungible_store",
         "transfer",
-        [type_arg],
+        [fungible_asset_metadata_type_tag()],
         [
+            # Object<Metadata> is passed as the token's metadata object address
+            TransactionArgument(AccountAddress.from_str(token_address), lambda s, addr: addr.serialize(s)),
             TransactionArgument(receiver, lambda s, addr: addr.serialize(s)),
             TransactionArgument(amount, Serializer.u64),
         ],
     )
-    
-    payload = TransactionPayload(entry)
+    return TransactionPayload(entry)
+
+
+async def fund_fungible_asset(client: AsyncRestClient, sender: Account, receiver: AccountAddress, token_address: str, amount: int) -> str:
+    """Fund an account with fungible assets"""
+    payload = fund_fungible_asset_payload(receiver, token_address, amount)
     return await submit_transaction(client, sender, payload)
 
 
+class TransactionReceipt(NamedTuple):
+    """The parts of a committed transaction callers act on"""
+    hash: str
+    version: int
+    success: bool
+    vm_status: str
+    gas_used: int
+    gas_unit_price: int
+    events: list
+
+    @classmethod
+    def from_transaction(cls, tx: Dict[str, Any]) -> "TransactionReceipt":
+        return cls(
+            hash=tx["hash"],
+            version=int(tx.get("version", 0)),
+            success=bool(tx.get("success", False)),
+            vm_status=tx.get("vm_status", ""),
+            gas_used=int(tx.get("gas_used", 0)),
+            gas_unit_price=int(tx.get("gas_unit_price", 0)),
+            events=tx.get("events", []),
+        )
+
+
+async def submit_transaction_receipt(client: AsyncRestClient, account: Account, payload: TransactionPayload) -> TransactionReceipt:
+    """Submit a transaction and return its receipt, events included"""
+    with metrics.track("submit_transaction"):
+        # Create and sign the transaction using the SDK method
+        signed_txn = await client.create_bcs_signed_transaction(account, payload)
+        
+        # Submit and wait; the SDK already returns the committed transaction
+        result = await client.submit_and_wait_for_bcs_transaction(signed_txn)
+    receipt = TransactionReceipt.from_transaction(result)
+    metrics.inc("transaction_gas_used_total", receipt.gas_used)
+    return receipt
+
+
 async def submit_transaction(client: AsyncRestClient, account: Account, payload: TransactionPayload) -> str:
     """Submit a transaction and return the hash"""
-    # Create and sign the transaction using the SDK method
-    signed_txn = await client.create_bcs_signed_transaction(account, payload)
-    
-    # Submit and wait
-    result = await client.submit_and_wait_for_bcs_transaction(signed_txn)
-    return result["hash"]
+    receipt = await submit_transaction_receipt(client, account, payload)
+    return receipt.hash
+
+
+class TransactionSubmitter:
+    """Pipelined transaction submitter for a single account
+
+    Tracks the account's sequence number locally so up to ``max_in_flight``
+    transactions can be pending at once; confirmations are resolved in the
+    background. A committed transaction resolves its future with a receipt,
+    ``success=False`` for a Move abort, since it still used its sequence
+    number. The sequence number is re-read from the node after a mismatch
+    or a transaction that expired or was discarded, once every other
+    in-flight transaction has settled.
+    """
+
+    def __init__(self, client: AsyncRestClient, account: Account, max_in_flight: int = 16):
+        self.client = client
+        self.account = account
+        self.max_in_flight = max_in_flight
+        self._sequence_number: Optional[int] = None
+        self._lock = asyncio.Lock()
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._confirmations: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted transactions still awaiting confirmation"""
+        return len(self._confirmations)
+
+    async def resync(self) -> int:
+        """Re-read the sequence number from the node"""
+        async with self._lock:
+            return await self._resync_locked()
+
+    async def _resync_locked(self) -> int:
+        # In-flight transactions own the numbers after the committed one, so
+        # wait them out rather than hand those numbers out again
+        if self._confirmations:
+            await asyncio.gather(*self._confirmations, return_exceptions=True)
+        self._sequence_number = await self.client.account_sequence_number(self.account.account_address)
+        return self._sequence_number
+
+    async def submit(self, payload: TransactionPayload) -> "asyncio.Future[TransactionReceipt]":
+        """Sign and submit a payload, returning a future for the transaction's receipt"""
+        _, future = await self.submit_with_hash(payload)
+        return future
+
+    async def submit_with_hash(self, payload: TransactionPayload) -> tuple[str, "asyncio.Future[TransactionReceipt]"]:
+        """Like submit, but also return the hash as soon as the node accepts the transaction"""
+        await self._window.acquire()
+        try:
+            tx_hash = await self._sign_and_submit(payload)
+        except BaseException:
+            self._window.release()
+            raise
+
+        future = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(self._confirm(tx_hash, future))
+        self._confirmations.add(task)
+        task.add_done_callback(self._confirmations.discard)
+        return tx_hash, future
+
+    async def submit_and_wait(self, payload: TransactionPayload) -> str:
+        """Submit a payload and wait for it to commit successfully, returning the hash"""
+        receipt = await (await self.submit(payload))
+        if not receipt.success:
+            raise RuntimeError(f"Transaction {receipt.hash} failed: {receipt.vm_status}")
+        return receipt.hash
+
+    async def drain(self):
+        """Wait until every in-flight transaction is confirmed or failed"""
+        if self._confirmations:
+            await asyncio.gather(*self._confirmations, return_exceptions=True)
+
+    async def _sign_and_submit(self, payload: TransactionPayload) -> str:
+        from aptos_sdk.async_client import ApiError
+        
+        async with self._lock:
+            if self._sequence_number is None:
+                await self._resync_locked()
+            for retry in range(2):
+                sequence_number = self._sequence_number
+                signed_txn = await self.client.create_bcs_signed_transaction(
+                    self.account, payload, sequence_number=sequence_number
+                )
+                try:
+                    with metrics.track("submit_pipelined"):
+                        tx_hash = await self.client.submit_bcs_transaction(signed_txn)
+                except ApiError as e:
+                    # Another writer or an expired transaction moved the sequence number
+                    if retry == 0 and "SEQUENCE_NUMBER" in str(e):
+                        metrics.inc("sequence_resyncs_total")
+                        await self._resync_locked()
+                        continue
+                    raise
+                # A confirmation failure may have cleared the counter meanwhile
+                if self._sequence_number == sequence_number:
+                    self._sequence_number = sequence_number + 1
+                return tx_hash
+
+    async def _committed(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """The committed transaction, successful or not, or None if it never committed"""
+        try:
+            tx = await self.client.transaction_by_hash(tx_hash)
+        except Exception:
+            return None
+        return tx if tx.get("type") == "user_transaction" else None
+
+    async def _confirm(self, tx_hash: str, future: asyncio.Future):
+        try:
+            try:
+                with metrics.track("confirm_transaction"):
+                    await self.client.wait_for_transaction(tx_hash)
+                    result = await self.client.transaction_by_hash(tx_hash)
+            except Exception as e:
+                # The SDK raises for a committed Move abort too, which used its number
+                result = await self._committed(tx_hash)
+                if result is None:
+                    # Expired or discarded: it leaves a gap in our local numbering
+                    self._sequence_number = None
+                    if not future.done():
+                        future.set_exception(e)
+                    return
+            receipt = TransactionReceipt.from_transaction(result)
+            metrics.inc("transaction_gas_used_total", receipt.gas_used)
+            if not receipt.success:
+                metrics.inc("transactions_aborted_total")
+            if not future.done():
+                future.set_result(receipt)
+        finally:
+            self._window.release()
 
 
 async def get_transaction_events(client: AsyncRestClient, tx_hash: str) -> list[Dict[str, Any]]:
     """Get events from a transaction"""
-    tx = await client.transaction_by_hash(tx_hash)
+    with metrics.track("get_transaction_events"):
+        tx = await client.transaction_by_hash(tx_hash)
     return tx.get("events", [])
 
 
+POT_EVENT_TYPES = ("created", "attempted", "completed", "expired")
+
+# Hex-encoded event_type -> name, so known types never need hex decoding
+_POT_EVENT_TYPE_BY_HEX = {"0x" + name.encode().hex(): name for name in POT_EVENT_TYPES}
+
+
+class PotEvent(NamedTuple):
+    """Decoded money_pot_manager::PotEvent"""
+    id: int
+    event_type: str
+    timestamp: int
+    actor: str
+    sequence_number: Optional[int] = None
+    version: Optional[int] = None
+
+
+def decode_pot_events(events: list[Dict[str, Any]]) -> list[PotEvent]:
+    """Decode every PotEvent in a list of raw events in a single pass"""
+    decoded = []
+    for event in events:
+        if event.get("type") != POT_EVENT_TYPE:
+            continue
+        data = event.get("data", {})
+        try:
+            event_type_hex = data["event_type"]
+            event_type = _POT_EVENT_TYPE_BY_HEX.get(event_type_hex)
+            if event_type is None:
+                event_type = bytes.fromhex(event_type_hex[2:]).decode()  # Remove '0x' prefix
+            sequence_number = event.get("sequence_number")
+            version = event.get("version")
+            decoded.append(PotEvent(
+                int(data["id"]),
+                event_type,
+                int(data["timestamp"]),
+                data["actor"],
+                None if sequence_number is None else int(sequence_number),
+                None if version is None else int(version),
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return decoded
+
+
+def collect_pot_event_ids(events: list[Dict[str, Any]]) -> Dict[str, list[int]]:
+    """Group the IDs of every PotEvent by event type"""
+    ids: Dict[str, list[int]] = {name: [] for name in POT_EVENT_TYPES}
+    for event in decode_pot_events(events):
+        if event.event_type in ids:
+            ids[event.event_type].append(event.id)
+    return ids
+
+
 def extract_pot_id_from_events(events: list[Dict[str, Any]]) -> Optional[int]:
     """Extract pot_id from PotEvent with event_type 'created'"""
-    for event in events:
-        if event.get("type") == f"{MODULE_ADDR}::money_pot_manager::PotEvent":
-            data = event.get("data", {})
-            event_type_hex = data.get("event_type", "")
-            if event_type_hex:
-                try:
-                    event_type = bytes.fromhex(event_type_hex[2:]).decode()  # Remove '0x' prefix
-                    if event_type == "created":
-                        return int(data.get("id", 0))
-                except:
-                    continue
-    return None
+    ids = collect_pot_event_ids(events)["created"]
+    return ids[0] if ids else None
 
 
 def extract_attempt_id_from_events(events: list[Dict[str, Any]]) -> Optional[int]:
     """Extract attempt_id from PotEvent with event_type 'attempted'"""
-    for event in events:
-        if event.get("type") == f"{MODULE_ADDR}::money_pot_manager::PotEvent":
-            data = event.get("data", {})
-            event_type_hex = data.get("event_type", "")
-            if event_type_hex:
-                try:
-                    event_type = bytes.fromhex(event_type_hex[2:]).decode()  # Remove '0x' prefix
-                    if event_type == "attempted":
-                        return int(data.get("id", 0))
-                except:
-                    continue
-    return None
+    ids = collect_pot_event_ids(events)["attempted"]
+    return ids[0] if ids else None
+
+
+async def view_function(client: AsyncRestClient, func_qn: str, args: list[str]) -> list:
+    with metrics.track("view_function", function=func_qn.rsplit("::", 1)[-1]):
+        res = await client.view(func_qn, [], args)
+    # Some SDK versions hand back the raw response body
+    if isinstance(res, (bytes, bytearray)):
+        res = json.loads(res)
+    return res
+
+
+def _u64_arg(value: int) -> str:
+    # The JSON view API takes u64 arguments as decimal strings
+    return str(value)
+
+
+class EncodedPayload:
+    """A TransactionPayload already serialized to BCS
+
+    Accepted anywhere the SDK serializes a payload, e.g. as the payload of
+    create_bcs_signed_transaction.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def serialize(self, serializer):
+        serializer.fixed_bytes(self.data)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, EncodedPayload) and other.data == self.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+
+# BCS struct format and length prefix of each entry function argument type
+_BCS_ARG_FORMATS = {"u64": ("Q", 8), "bool": ("?", 1), "address": ("32s", 32)}
+
+
+def _address_bytes(address) -> bytes:
+    if isinstance(address, str):
+        return bytes.fromhex(address[2:].zfill(64) if address.startswith("0x") else address.zfill(64))
+    return address.address
+
+
+class PayloadTemplate:
+    """Entry function payload with its module, function and type arguments serialized once
+
+    Each payload is the constant prefix plus the arguments, packed with a
+    single precompiled struct (BCS writes each entry function argument as
+    a length-prefixed byte string).
+    """
+
+    def __init__(self, module: str, function: str, arg_types: Iterable[str]):
+        from aptos_sdk.bcs import Serializer
+        from aptos_sdk.transactions import EntryFunction, TransactionPayload
+        
+        self.module = module
+        self.function = function
+        self.arg_types = tuple(arg_types)
+        serializer = Serializer()
+        TransactionPayload(EntryFunction.natural(module, function, [], [])).serialize(serializer)
+        # Swap the trailing empty argument count for ours (under 128, so one byte)
+        self.prefix = serializer.output()[:-1] + bytes([len(self.arg_types)])
+        self._struct = struct.Struct("<" + "".join("B" + _BCS_ARG_FORMATS[t][0] for t in self.arg_types))
+        self._lengths = tuple(_BCS_ARG_FORMATS[t][1] for t in self.arg_types)
+        self._addresses = tuple(i for i, t in enumerate(self.arg_types) if t == "address")
+
+    def encode(self, *args) -> bytes:
+        """BCS bytes of the payload for one set of arguments"""
+        if self._addresses:
+            args = list(args)
+            for i in self._addresses:
+                args[i] = _address_bytes(args[i])
+        values = [value for pair in zip(self._lengths, args) for value in pair]
+        return self.prefix + self._struct.pack(*values)
+
+    def payload(self, *args) -> EncodedPayload:
+        return EncodedPayload(self.encode(*args))
+
+    def payloads(self, arg_rows: Iterable[tuple]) -> list[EncodedPayload]:
+        """Encode many argument tuples at once"""
+        prefix, pack, lengths = self.prefix, self._struct.pack, self._lengths
+        if self._addresses:
+            return [self.payload(*args) for args in arg_rows]
+        return [
+            EncodedPayload(prefix + pack(*[value for pair in zip(lengths, args) for value in pair]))
+            for args in arg_rows
+        ]
+
+
+# Argument types of the money_pot_manager entry functions
+MONEY_POT_ENTRY_FUNCTIONS = {
+    "create_pot_entry": ("u64", "u64", "u64", "address"),
+    "attempt_pot_entry": ("u64",),
+    "attempt_completed": ("u64", "bool"),
+    "expire_pot": ("u64",),
+}
+
+_entry_function_templates: Dict[str, PayloadTemplate] = {}
+
+
+def entry_function_template(function: str) -> PayloadTemplate:
+    """The cached PayloadTemplate for a money_pot_manager entry function"""
+    template = _entry_function_templates.get(function)
+    if template is None:
+        template = PayloadTemplate(MODULE_QN, function, MONEY_POT_ENTRY_FUNCTIONS[function])
+        _entry_function_templates[function] = template
+    return template
 
 
-async def view_function(client: AsyncRestClient, func_qn: str, args: list[bytes]) -> list:
-    return await client.view(func_qn, [], args)
+def create_pot_payload(amount: int, duration_seconds: int, fee: int, one_fa_address: AccountAddress) -> EncodedPayload:
+    """Build the create_pot_entry payload"""
+    return entry_function_template("create_pot_entry").payload(amount, duration_seconds, fee, one_fa_address)
 
 
 async def create_pot(
@@ -174,123 +567,913 @@ async def create_pot(
     one_fa_address: AccountAddress,
 ) -> str:
     """Create pot and return transaction hash"""
-    # Use TransactionArgument objects with correct encoders
-    entry = EntryFunction.natural(
-        MODULE_QN,
-        "create_pot_entry",
-        [],
-        [
-            TransactionArgument(amount, Serializer.u64),
-            TransactionArgument(duration_seconds, Serializer.u64),
-            TransactionArgument(fee, Serializer.u64),
-            TransactionArgument(one_fa_address, lambda s, addr: addr.serialize(s)),
-        ],
-    )
-    
-    payload = TransactionPayload(entry)
+    payload = create_pot_payload(amount, duration_seconds, fee, one_fa_address)
     return await submit_transaction(client, creator, payload)
 
 
+def attempt_pot_payload(pot_id: int) -> EncodedPayload:
+    """Build the attempt_pot_entry payload"""
+    return entry_function_template("attempt_pot_entry").payload(pot_id)
+
+
 async def attempt_pot(client: AsyncRestClient, hunter: Account, pot_id: int) -> str:
     """Attempt pot and return transaction hash"""
-    entry = EntryFunction.natural(
-        MODULE_QN,
-        "attempt_pot_entry",
-        [],
-        [TransactionArgument(pot_id, Serializer.u64)],
-    )
-    
-    payload = TransactionPayload(entry)
+    payload = attempt_pot_payload(pot_id)
     return await submit_transaction(client, hunter, payload)
 
 
+def attempt_completed_payload(attempt_id: int, status: bool) -> EncodedPayload:
+    """Build the attempt_completed payload"""
+    return entry_function_template("attempt_completed").payload(attempt_id, status)
+
+
 async def attempt_completed(
     client: AsyncRestClient, oracle: Account, attempt_id: int, status: bool
 ) -> str:
     """Mark attempt as completed and return transaction hash"""
-    entry = EntryFunction.natural(
-        MODULE_QN,
-        "attempt_completed",
-        [],
-        [
-            TransactionArgument(attempt_id, Serializer.u64),
-            TransactionArgument(status, Serializer.bool),
-        ],
-    )
-    
-    payload = TransactionPayload(entry)
+    payload = attempt_completed_payload(attempt_id, status)
     return await submit_transaction(client, oracle, payload)
 
 
+def expire_pot_payload(pot_id: int) -> EncodedPayload:
+    """Build the expire_pot payload"""
+    return entry_function_template("expire_pot").payload(pot_id)
+
+
+async def expire_pot(client: AsyncRestClient, account: Account, pot_id: int) -> str:
+    """Expire pot and return transaction hash"""
+    return await submit_transaction(client, account, expire_pot_payload(pot_id))
+
+
 async def get_active_pots(client: AsyncRestClient) -> list[int]:
     res = await view_function(client, f"{MODULE_QN}::get_active_pots", [])
-    return [int(x) for x in res]
+    return [int(x) for x in res[0]]
 
 
 async def get_pots(client: AsyncRestClient) -> list[int]:
     res = await view_function(client, f"{MODULE_QN}::get_pots", [])
-    return [int(x) for x in res]
+    return [int(x) for x in res[0]]
 
 
 async def get_attempt(client: AsyncRestClient, attempt_id: int) -> dict:
-    ser = Serializer()
-    ser.u64(attempt_id)
-    res = await view_function(client, f"{MODULE_QN}::get_attempt", [ser.output()])
+    res = await view_function(client, f"{MODULE_QN}::get_attempt", [_u64_arg(attempt_id)])
     return res  # SDK returns decoded fields; keep generic
 
+
+async def get_pot(client: AsyncRestClient, pot_id: int) -> dict:
+    res = await view_function(client, f"{MODULE_QN}::get_pot", [_u64_arg(pot_id)])
+    return res
+
+
+class MoneyPot(NamedTuple):
+    """Decoded money_pot_manager::MoneyPot"""
+    id: int
+    creator: str
+    total_amount: int
+    fee: int
+    created_at: int
+    expires_at: int
+    is_active: bool
+    attempts_count: int
+    one_fa_address: str
+    token: str
+
+    @classmethod
+    def from_view(cls, res: list) -> "MoneyPot":
+        data = res[0]
+        return cls(
+            id=int(data["id"]),
+            creator=data["creator"],
+            total_amount=int(data["total_amount"]),
+            fee=int(data["fee"]),
+            created_at=int(data["created_at"]),
+            expires_at=int(data["expires_at"]),
+            is_active=bool(data["is_active"]),
+            attempts_count=int(data["attempts_count"]),
+            one_fa_address=data["one_fa_address"],
+            token=data["token"],
+        )
+
+
+class Attempt(NamedTuple):
+    """Decoded money_pot_manager::Attempt"""
+    id: int
+    pot_id: int
+    hunter: str
+    expires_at: int
+    difficulty: int
+    is_completed: bool
+
+    @classmethod
+    def from_view(cls, res: list) -> "Attempt":
+        data = res[0]
+        return cls(
+            id=int(data["id"]),
+            pot_id=int(data["pot_id"]),
+            hunter=data["hunter"],
+            expires_at=int(data["expires_at"]),
+            difficulty=int(data["difficulty"]),
+            is_completed=bool(data["is_completed"]),
+        )
+
+
+async def _view_many(client: AsyncRestClient, func_qn: str, ids: Iterable[int], concurrency: int) -> Dict[int, list]:
+    """Call a single-u64 view function for every ID with at most `concurrency` requests in flight
+
+    All or nothing: the first failing call cancels the rest and its error is
+    raised, so no calls are left running behind the caller.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def view_one(item_id: int) -> list:
+        async with semaphore:
+            return await view_function(client, func_qn, [_u64_arg(item_id)])
+
+    tasks = {item_id: asyncio.ensure_future(view_one(item_id)) for item_id in dict.fromkeys(ids)}
+    if not tasks:
+        return {}
+    try:
+        done, _ = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # On the first error, or if the caller is cancelled, stop the stragglers
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return {item_id: task.result() for item_id, task in tasks.items()}
+
+
+async def get_pots_bulk(client: AsyncRestClient, pot_ids: Iterable[int], concurrency: int = 32) -> Dict[int, MoneyPot]:
+    """Fetch and decode many pots concurrently, keyed by pot ID; raises the first failed lookup's error"""
+    results = await _view_many(client, f"{MODULE_QN}::get_pot", pot_ids, concurrency)
+    return {pot_id: MoneyPot.from_view(res) for pot_id, res in results.items()}
+
+
+async def get_attempts_bulk(client: AsyncRestClient, attempt_ids: Iterable[int], concurrency: int = 32) -> Dict[int, Attempt]:
+    """Fetch and decode many attempts concurrently, keyed by attempt ID; raises the first failed lookup's error"""
+    results = await _view_many(client, f"{MODULE_QN}::get_attempt", attempt_ids, concurrency)
+    return {attempt_id: Attempt.from_view(res) for attempt_id, res in results.items()}
+
+
+async def get_active_pots_bulk(client: AsyncRestClient, concurrency: int = 32) -> Dict[int, MoneyPot]:
+    """Fetch every active pot as a decoded record"""
+    return await get_pots_bulk(client, await get_active_pots(client), concurrency)
+
+
+class NodeViewClient:
+    """Fullnode client for view calls only, built on the standard library
+
+    An import-light stand-in for the SDK's RestClient on read-only paths.
+    Requests run on the loop's default executor over a small pool of
+    keep-alive connections.
+    """
+
+    def __init__(self, base_url: str = NODE_URL, timeout: float = 10.0):
+        from urllib.parse import urlsplit
+        url = urlsplit(base_url.rstrip("/"))
+        self.base_url = base_url.rstrip("/")
+        self.https = url.scheme == "https"
+        self.host = url.netloc
+        self.path = url.path
+        self.timeout = timeout
+        self._idle: list = []
+
+    def _connection(self):
+        import http.client
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return connection_class(self.host, timeout=self.timeout)
+
+    def _post(self, path: str, body: bytes) -> Any:
+        for retry in range(2):
+            # Executor threads share the pool: pop, don't check then pop
+            try:
+                connection = self._idle.pop()
+                reused = True
+            except IndexError:
+                connection = self._connection()
+                reused = False
+            try:
+                connection.request("POST", f"{self.path}{path}", body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                data = response.read()
+            except OSError:
+                connection.close()
+                # The node may have closed an idle keep-alive connection
+                if reused and retry == 0:
+                    continue
+                raise
+            self._idle.append(connection)
+            if response.status >= 400:
+                raise RuntimeError(f"View request failed ({response.status}): {data.decode(errors='replace')}")
+            return json.loads(data)
+
+    async def view(self, function: str, type_arguments: list, arguments: list, ledger_version: Optional[int] = None) -> list:
+        path = "/view" if ledger_version is None else f"/view?ledger_version={ledger_version}"
+        body = json.dumps({"function": function, "type_arguments": type_arguments, "arguments": arguments}).encode()
+        return await asyncio.get_running_loop().run_in_executor(None, self._post, path, body)
+
+    async def close(self):
+        while True:
+            try:
+                connection = self._idle.pop()
+            except IndexError:
+                return
+            connection.close()
+
+
+NODE_HEDGE_AFTER = float(os.getenv("NODE_HEDGE_AFTER_MS", "250")) / 1000
+NODE_UNHEALTHY_AFTER = int(os.getenv("NODE_UNHEALTHY_AFTER", "3"))
+NODE_COOLDOWN_SECONDS = float(os.getenv("NODE_COOLDOWN_SECONDS", "30"))
+
+# Statuses meaning the node, not the request, is at fault
+NODE_FAULT_STATUSES = (429, 500, 502, 503, 504)
+
+
+async def fetch_events_by_handle(
+    rest_client: AsyncRestClient, address, event_handle: str, field_name: str, start: Optional[int] = None, limit: Optional[int] = None
+) -> list[Dict[str, Any]]:
+    """GET /accounts/{address}/events/{event_handle}/{field_name} through one SDK client"""
+    from aptos_sdk.async_client import ApiError
+
+    params = {key: value for key, value in (("start", start), ("limit", limit)) if value is not None}
+    response = await rest_client.client.get(
+        f"{rest_client.base_url}/accounts/{address}/events/{event_handle}/{field_name}", params=params
+    )
+    if response.status_code >= 400:
+        raise ApiError(response.text, response.status_code)
+    return response.json()
+
+
+class LimitedNodeClient:
+    """RestClient wrapper queuing calls on one fullnode's adaptive limits
+
+    Reads share the node's "view" limit and submissions its "submit" limit;
+    a 429 or 503 from the node shrinks the limit. Anything else, including
+    the raw httpx client, is delegated to the wrapped client.
+    """
+
+    READ_METHODS = ("view", "account", "account_resource", "account_sequence_number", "transaction_by_hash")
+
+    def __init__(self, rest_client: AsyncRestClient):
+        # Not named `client`: callers reach the SDK's own `client` (httpx) through __getattr__
+        self.rest_client = rest_client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.rest_client, name)
+        if name not in self.READ_METHODS:
+            return attr
+
+        async def read(*args, **kwargs):
+            return await self._limited("view", attr, *args, **kwargs)
+        return read
+
+    async def _limited(self, endpoint_class: str, method, *args, **kwargs):
+        from aptos_sdk.async_client import ApiError
+
+        async with upstream_slot(self.rest_client.base_url, endpoint_class) as slot:
+            try:
+                return await method(*args, **kwargs)
+            except ApiError as e:
+                if e.status_code in OVERLOAD_STATUSES:
+                    slot.overloaded()
+                raise
+
+    async def create_bcs_signed_transaction(self, sender: Account, payload: TransactionPayload, sequence_number: Optional[int] = None):
+        if sequence_number is None:
+            # The SDK would read it itself, bypassing the limit
+            sequence_number = await self.account_sequence_number(sender.account_address)
+        return await self.rest_client.create_bcs_signed_transaction(sender, payload, sequence_number=sequence_number)
+
+    async def events_by_handle(self, address, event_handle: str, field_name: str, start: Optional[int] = None, limit: Optional[int] = None) -> list[Dict[str, Any]]:
+        return await self._limited(
+            "view", fetch_events_by_handle, self.rest_client, address, event_handle, field_name, start, limit
+        )
+
+    async def submit_bcs_transaction(self, signed_transaction) -> str:
+        return await self._limited("submit", self.rest_client.submit_bcs_transaction, signed_transaction)
+
+    async def wait_for_transaction(self, tx_hash: str):
+        # Not limited: a long poll holding a slot would starve the node's other reads
+        await self.rest_client.wait_for_transaction(tx_hash)
+
+    async def submit_and_wait_for_bcs_transaction(self, signed_transaction) -> Dict[str, Any]:
+        tx_hash = await self.submit_bcs_transaction(signed_transaction)
+        await self.wait_for_transaction(tx_hash)
+        return await self.transaction_by_hash(tx_hash)
+
+
+class NodeEndpoint:
+    """One fullnode behind a MultiNodeClient, with its latency and health"""
+
+    def __init__(self, url: str, client: AsyncRestClient):
+        self.url = url
+        self.client = client
+        self.latency: Optional[float] = None  # EWMA of request seconds
+        self.failures = 0  # Consecutive node faults
+        self.unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.unhealthy_until <= time.monotonic()
+
+
+class MultiNodeClient:
+    """RestClient stand-in that spreads calls over several fullnodes
+
+    Reads go to the healthy node with the lowest latency and are hedged:
+    without an answer after ``hedge_after`` seconds the read is also sent to
+    the next node and the first answer wins. Writes go to the best node and
+    fail over to the next on a node fault; a node with ``unhealthy_after``
+    consecutive faults is skipped for ``cooldown`` seconds.
+
+    Sequence numbers are only ever taken from committed state, and the
+    highest value seen from any node is kept per account, so a lagging node
+    can never move an account's sequence number backwards.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        hedge_after: float = NODE_HEDGE_AFTER,
+        unhealthy_after: int = NODE_UNHEALTHY_AFTER,
+        cooldown: float = NODE_COOLDOWN_SECONDS,
+        latency_alpha: float = 0.2,
+    ):
+        from aptos_sdk.async_client import RestClient as AsyncRestClient
+        self.nodes = [NodeEndpoint(url, LimitedNodeClient(AsyncRestClient(url))) for url in urls]
+        if not self.nodes:
+            raise ValueError("MultiNodeClient needs at least one fullnode URL")
+        self.hedge_after = hedge_after
+        self.unhealthy_after = unhealthy_after
+        self.cooldown = cooldown
+        self.latency_alpha = latency_alpha
+        self._sequence_numbers: Dict[str, int] = {}
+        self._submitted_to: "OrderedDict[str, NodeEndpoint]" = OrderedDict()
+
+    def __getattr__(self, name: str):
+        # Anything not routed here uses the first node; read through the
+        # routed methods (e.g. events_by_handle) rather than the raw httpx client
+        return getattr(self.nodes[0].client, name)
+
+    def ranked(self) -> list[NodeEndpoint]:
+        """Healthy nodes fastest first, then unhealthy ones soonest to recover"""
+        # Unmeasured nodes sort first so each one gets probed
+        healthy = sorted((node for node in self.nodes if node.healthy), key=lambda node: node.latency or 0.0)
+        unhealthy = sorted((node for node in self.nodes if not node.healthy), key=lambda node: node.unhealthy_until)
+        return healthy + unhealthy
+
+    @staticmethod
+    def is_node_fault(e: BaseException) -> bool:
+        """Whether another node might succeed where this one failed"""
+        import httpx
+        from aptos_sdk.async_client import ApiError
+        if isinstance(e, ApiError):
+            return e.status_code in NODE_FAULT_STATUSES
+        return isinstance(e, (httpx.TransportError, asyncio.TimeoutError, OSError))
+
+    def _record_latency(self, node: NodeEndpoint, elapsed: float):
+        if node.latency is None:
+            node.latency = elapsed
+        else:
+            node.latency += self.latency_alpha * (elapsed - node.latency)
+
+    def _record_failure(self, node: NodeEndpoint):
+        node.failures += 1
+        if node.failures >= self.unhealthy_after:
+            node.unhealthy_until = time.monotonic() + self.cooldown
+            metrics.inc("node_unhealthy_total", node=node.url)
+
+    async def _call(self, node: NodeEndpoint, method: str, *args, timed: bool = True, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = await getattr(node.client, method)(*args, **kwargs)
+        except asyncio.CancelledError:
+            # Lost a hedge race, so it was at least this slow
+            if timed:
+                self._record_latency(node, time.perf_counter() - started)
+            raise
+        except Exception as e:
+            if self.is_node_fault(e):
+                self._record_failure(node)
+            raise
+        if timed:
+            self._record_latency(node, time.perf_counter() - started)
+        node.failures = 0
+        return result
+
+    async def _read(self, method: str, *args, **kwargs):
+        """Send a read to the best node, hedging to the next one when it is slow or failing"""
+        nodes = self.ranked()
+        pending: set[asyncio.Task] = set()
+        launched = 0
+        error: Optional[BaseException] = None
+
+        def launch():
+            nonlocal launched
+            pending.add(asyncio.create_task(self._call(nodes[launched], method, *args, **kwargs)))
+            launched += 1
+
+        launch()
+        try:
+            while pending:
+                timeout = self.hedge_after if launched < len(nodes) else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    metrics.inc("node_hedged_reads_total", method=method)
+                    launch()
+                    continue
+                for task in done:
+                    e = task.exception()
+                    if e is None:
+                        return task.result()
+                    if not self.is_node_fault(e):
+                        raise e
+                    error = e
+                if launched < len(nodes) and not pending:
+                    metrics.inc("node_failovers_total", method=method)
+                    launch()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _failover(self, nodes: list[NodeEndpoint], method: str, *args, timed: bool = True, **kwargs):
+        """Try nodes in turn until one answers; returns (node, result)"""
+        error: Optional[BaseException] = None
+        for node in nodes:
+            try:
+                return node, await self._call(node, method, *args, timed=timed, **kwargs)
+            except Exception as e:
+                if not self.is_node_fault(e):
+                    raise
+                metrics.inc("node_failovers_total", method=method)
+                error = e
+        raise error
+
+    def _submitted_first(self, tx_hash: str) -> list[NodeEndpoint]:
+        """Ranked nodes, starting with the one a transaction was submitted to"""
+        nodes = self.ranked()
+        node = self._submitted_to.get(tx_hash)
+        if node is not None:
+            nodes.remove(node)
+            nodes.insert(0, node)
+        return nodes
+
+    def _observe_sequence_number(self, address, sequence_number: int) -> int:
+        key = str(address)
+        sequence_number = max(sequence_number, self._sequence_numbers.get(key, 0))
+        self._sequence_numbers[key] = sequence_number
+        return sequence_number
+
+    async def view(self, function: str, type_arguments: list, arguments: list, ledger_version: Optional[int] = None) -> list:
+        return await self._read("view", function, type_arguments, arguments, ledger_version)
+
+    async def account_resource(self, account_address, resource_type: str, ledger_version: Optional[int] = None) -> Dict[str, Any]:
+        return await self._read("account_resource", account_address, resource_type, ledger_version)
+
+    async def events_by_handle(self, address, event_handle: str, field_name: str, start: Optional[int] = None, limit: Optional[int] = None) -> list[Dict[str, Any]]:
+        return await self._read("events_by_handle", address, event_handle, field_name, start, limit)
+
+    async def account_sequence_number(self, account_address, ledger_version: Optional[int] = None) -> int:
+        """The account's committed sequence number, never lower than one seen before"""
+        sequence_number = await self._read("account_sequence_number", account_address, ledger_version)
+        if ledger_version is not None:
+            return sequence_number
+        return self._observe_sequence_number(account_address, sequence_number)
+
+    async def create_bcs_signed_transaction(self, sender: Account, payload: TransactionPayload, sequence_number: Optional[int] = None):
+        if sequence_number is None:
+            sequence_number = await self.account_sequence_number(sender.account_address)
+        # Signing is local apart from the chain ID, which each client caches
+        _, signed_txn = await self._failover(
+            self.ranked(), "create_bcs_signed_transaction", sender, payload, sequence_number=sequence_number
+        )
+        return signed_txn
+
+    async def submit_bcs_transaction(self, signed_transaction) -> str:
+        """Submit to the best node, failing over to the others on node faults
+
+        Resubmitting the same signed transaction is safe: it has one sequence
+        number, so it commits at most once. If a node that failed had in fact
+        committed it, the next node rejects it as too old and the committed
+        transaction's hash is returned instead.
+        """
+        ambiguous = False
+        error: Optional[BaseException] = None
+        for node in self.ranked():
+            try:
+                tx_hash = await self._call(node, "submit_bcs_transaction", signed_transaction)
+            except Exception as e:
+                if ambiguous and "SEQUENCE_NUMBER_TOO_OLD" in str(e):
+                    tx_hash = await self._committed_hash(signed_transaction)
+                    if tx_hash is not None:
+                        return tx_hash
+                if not self.is_node_fault(e):
+                    raise
+                metrics.inc("node_failovers_total", method="submit_bcs_transaction")
+                ambiguous = True
+                error = e
+                continue
+            self._submitted_to[tx_hash] = node
+            while len(self._submitted_to) > 4096:
+                self._submitted_to.popitem(last=False)
+            return tx_hash
+        raise error
+
+    async def _committed_hash(self, signed_transaction) -> Optional[str]:
+        """Hash of the committed transaction at this one's sender and sequence number"""
+        raw = signed_transaction.transaction
+        for node in self.ranked():
+            try:
+                response = await node.client.client.get(
+                    f"{node.client.base_url}/accounts/{raw.sender}/transactions",
+                    params={"start": raw.sequence_number, "limit": 1},
+                )
+            except Exception:
+                continue
+            if response.status_code == 200 and response.json():
+                return response.json()[0]["hash"]
+        return None
+
+    async def wait_for_transaction(self, tx_hash: str):
+        """Wait on the node the transaction was submitted to, failing over if it dies"""
+        await self._failover(self._submitted_first(tx_hash), "wait_for_transaction", tx_hash, timed=False)
+
+    async def transaction_by_hash(self, tx_hash: str) -> Dict[str, Any]:
+        if tx_hash in self._submitted_to:
+            # Other nodes may not have caught up with our own transactions yet
+            _, tx = await self._failover(self._submitted_first(tx_hash), "transaction_by_hash", tx_hash)
+        else:
+            tx = await self._read("transaction_by_hash", tx_hash)
+        if tx.get("type") == "user_transaction" and "sequence_number" in tx:
+            self._observe_sequence_number(tx["sender"], int(tx["sequence_number"]) + 1)
+        return tx
+
+    async def submit_and_wait_for_bcs_transaction(self, signed_transaction) -> Dict[str, Any]:
+        tx_hash = await self.submit_bcs_transaction(signed_transaction)
+        await self.wait_for_transaction(tx_hash)
+        return await self.transaction_by_hash(tx_hash)
+
+    async def close(self):
+        for node in self.nodes:
+            await node.client.close()
+
+
+def node_client(urls: Union[str, Iterable[str]] = NODE_URLS) -> AsyncRestClient:
+    """A rate-limited RestClient for one fullnode URL, or a MultiNodeClient for several"""
+    urls = [urls] if isinstance(urls, str) else list(urls)
+    if len(urls) == 1:
+        from aptos_sdk.async_client import RestClient as AsyncRestClient
+        return LimitedNodeClient(AsyncRestClient(urls[0]))
+    return MultiNodeClient(urls)
+
+
+# Seconds each view result stays cached; None caches for the lifetime of the
+# process and functions missing here are never cached
+VIEW_CACHE_TTLS: Dict[str, Optional[float]] = {
+    "get_token": None,
+    "get_resource_address": None,
+    "get_verifier_oracle": None,
+    "get_pot": 30.0,
+    "get_attempt": 30.0,
+    "get_active_pots": 5.0,
+    "get_pots": 5.0,
+    "get_balance": 5.0,
+}
+
+
+class CachingViewClient:
+    """AsyncRestClient wrapper that caches view results with TTLs and LRU eviction
+
+    Everything other than ``view`` is delegated to the wrapped client, so it can
+    be passed anywhere a client is expected. Mutable pot and attempt entries are
+    dropped when a matching PotEvent is fed to ``apply_events``.
+    """
+
+    def __init__(self, client: AsyncRestClient, ttls: Optional[Dict[str, Optional[float]]] = None, max_entries: int = 4096):
+        self.client = client
+        self.ttls = VIEW_CACHE_TTLS if ttls is None else ttls
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, tuple[Optional[float], list]]" = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._generation = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    async def view(self, function: str, type_arguments: list, arguments: list, ledger_version: Optional[int] = None) -> list:
+        name = function.rsplit("::", 1)[-1]
+        if ledger_version is not None or name not in self.ttls:
+            return await self.client.view(function, type_arguments, arguments, ledger_version)
+
+        key = (function, tuple(type_arguments), tuple(arguments))
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.inc("view_cache_hits_total", function=name)
+                return value
+            del self._entries[key]
+
+        # Coalesce concurrent misses for the same key into one request
+        if key in self._inflight:
+            self.hits += 1
+            metrics.inc("view_cache_hits_total", function=name)
+            leader = self._inflight[key]
+            try:
+                return await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise  # This caller was cancelled
+            # The leading caller was cancelled; read again rather than fail
+            return await self.view(function, type_arguments, arguments)
+
+        self.misses += 1
+        metrics.inc("view_cache_misses_total", function=name)
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self.client.view(function, type_arguments, arguments)
+        except asyncio.CancelledError:
+            # Followers would otherwise wait on this future forever; they retry
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(value)
+        # Skip storing a result that an invalidation raced with
+        if generation == self._generation:
+            ttl = self.ttls[name]
+            self._entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, name: Optional[str] = None, item_id: Optional[int] = None):
+        """Drop cached entries for a view function name, optionally for one u64 argument"""
+        self._generation += 1
+        if name is None:
+            self._entries.clear()
+            return
+        function = f"{MODULE_QN}::{name}"
+        if item_id is not None:
+            self._entries.pop((function, (), (_u64_arg(item_id),)), None)
+            return
+        for key in [key for key in self._entries if key[0] == function]:
+            del self._entries[key]
+
+    def _cached_attempt_pot_id(self, attempt_id: int) -> Optional[int]:
+        entry = self._entries.get((f"{MODULE_QN}::get_attempt", (), (_u64_arg(attempt_id),)))
+        if entry is None:
+            return None
+        return int(entry[1][0]["pot_id"])
+
+    def apply_events(self, events: list[Dict[str, Any]]):
+        """Invalidate entries touched by the PotEvents in a transaction's events"""
+        for event in decode_pot_events(events):
+            event_type, item_id = event.event_type, event.id
+            if event_type in ("created", "expired"):
+                self.invalidate("get_pot", item_id)
+            elif event_type in ("attempted", "completed"):
+                # The attempt's pot changes too (attempt count, balance)
+                pot_id = self._cached_attempt_pot_id(item_id)
+                self.invalidate("get_attempt", item_id)
+                if pot_id is not None:
+                    self.invalidate("get_pot", pot_id)
+                else:
+                    self.invalidate("get_pot")
+            self.invalidate("get_active_pots")
+            self.invalidate("get_pots")
+
+
+class ChallengeSolver:
+    """Solves 1P challenges by finding each password character's color group
+
+    Challenge i is answered for password character ``password[i % len(password)]``,
+    so single-letter and multi-character passwords share one path. Only the
+    groups are scanned, stopping at the one holding the character; characters
+    missing from every color group are answered with ``skip``.
+    """
+
+    def __init__(self, legend: Dict[str, str], skip: str = "S"):
+        self.legend = legend
+        self.skip = skip
+
+    def solve(self, challenges: list[Dict[str, Any]], password: str) -> list[str]:
+        """Solve one attempt's challenge set"""
+        if not password:
+            raise ValueError("Cannot solve challenges without a password")
+        legend, skip, length = self.legend, self.skip, len(password)
+        solutions = []
+        for i, challenge in enumerate(challenges):
+            char = password[i % length]
+            for color, chars in challenge.get("colorGroups", {}).items():
+                if char in chars:
+                    solutions.append(legend.get(color, skip))
+                    break
+            else:
+                solutions.append(skip)
+        return solutions
+
+    def solve_batch(self, batch: Iterable[tuple[list[Dict[str, Any]], str]]) -> list[list[str]]:
+        """Solve many (challenges, password) sets; a convenience loop over solve, no faster per set"""
+        solve = self.solve
+        return [solve(challenges, password) for challenges, password in batch]
+
+
+RSA_KEY_CACHE_SIZE = 64
+
+_rsa_public_keys: "OrderedDict[str, Any]" = OrderedDict()
+# Keys are loaded from executor threads, so the LRU is only touched under this lock
+_rsa_public_keys_lock = threading.Lock()
+_rsa_oaep_padding = None
+
+
+def rsa_oaep_padding():
+    """OAEP with SHA-256, built once on first use"""
+    global _rsa_oaep_padding
+    if _rsa_oaep_padding is None:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        # Racing threads may each build one; they are equivalent and immutable
+        _rsa_oaep_padding = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+    return _rsa_oaep_padding
+
+
+def load_rsa_public_key(public_key_pem: str):
+    """Load a PEM public key, cached by the PEM's SHA-256 fingerprint"""
+    fingerprint = hashlib.sha256(public_key_pem.encode()).hexdigest()
+    with _rsa_public_keys_lock:
+        public_key = _rsa_public_keys.get(fingerprint)
+        if public_key is not None:
+            _rsa_public_keys.move_to_end(fingerprint)
+            return public_key
+
+    # Parsed outside the lock so other keys aren't held up; a racing load of
+    # the same PEM just parses it twice
+    from cryptography.hazmat.primitives import serialization
+    public_key = serialization.load_pem_public_key(public_key_pem.encode())
+    with _rsa_public_keys_lock:
+        _rsa_public_keys[fingerprint] = public_key
+        if len(_rsa_public_keys) > RSA_KEY_CACHE_SIZE:
+            _rsa_public_keys.popitem(last=False)
+    return public_key
+
+
+# Per-endpoint total timeouts in seconds
+VERIFIER_TIMEOUTS: Dict[str, float] = {
+    "health": 5.0,
+    "register_options": 10.0,
+    "register_verify": 15.0,
+    "authenticate_options": 10.0,
+    "authenticate_verify": 15.0,
+}
+
+# Statuses worth retrying idempotent requests on
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# The subset the verifier sheds load with before doing any work. 502 and 504
+# come from a proxy, and the origin may already have processed the request,
+# so non-idempotent requests are only retried on these.
+SHED_STATUSES = (429, 503)
+
+
 class VerifierServiceClient:
-    """Client for interacting with the Money Pot Verifier Service"""
+    """Client for interacting with the Money Pot Verifier Service
+
+    Holds one long-lived aiohttp session and connection pool, created on first
+    use and shared by every concurrent caller; ``async with`` no longer closes
+    it, call ``close`` when done with the client. Requests queue on the
+    process-wide adaptive limits for their endpoint class (see limiter.py).
+    """
     
-    def __init__(self, base_url: str):
-        self.base_url = base_url
+    def __init__(
+        self,
+        base_url: str,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30.0,
+        timeouts: Optional[Dict[str, float]] = None,
+        retries: int = 3,
+        backoff: float = 0.2,
+        executor: Optional[Executor] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeouts = {**VERIFIER_TIMEOUTS, **(timeouts or {})}
+        self.retries = retries
+        self.backoff = backoff
+        self.executor = executor  # None runs RSA work on the loop's default executor
         self.session = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        import aiohttp
+        
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+    
+    async def close(self):
+        """Close the shared session and its pooled connections"""
         if self.session:
             await self.session.close()
+            self.session = None
     
     def encrypt_with_rsa(self, data: str, public_key_pem: str) -> str:
-        """Encrypt data with RSA public key using OAEP padding"""
-        try:
-            print(f"Encrypting data length: {len(data)}")
-            print(f"Public key PEM (first 100 chars): {public_key_pem[:100]}...")
-            
-            # Load the public key from PEM format
-            public_key = serialization.load_pem_public_key(public_key_pem.encode())
-            
-            # Encrypt the data
-            encrypted = public_key.encrypt(
-                data.encode('utf-8'),
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
-            )
-            
-            print(f"Encryption successful, encrypted length: {len(encrypted)}")
-            # Return as hex string
-            return encrypted.hex()
-        except Exception as e:
-            print(f"RSA encryption error: {e}")
-            import traceback
-            traceback.print_exc()
-            # Fallback to simple hex encoding for MVP
-            return data.encode().hex()
+        """Encrypt data with RSA public key using OAEP padding, returning hex"""
+        public_key = load_rsa_public_key(public_key_pem)
+        return public_key.encrypt(data.encode('utf-8'), rsa_oaep_padding()).hex()
+    
+    def encrypt_many_with_rsa(self, payloads: Iterable[str], public_key_pem: str) -> list[str]:
+        """Encrypt many payloads under one RSA public key"""
+        encrypt = load_rsa_public_key(public_key_pem).encrypt
+        oaep = rsa_oaep_padding()
+        return [encrypt(data.encode('utf-8'), oaep).hex() for data in payloads]
+    
+    async def encrypt_with_rsa_async(self, data: str, public_key_pem: str) -> str:
+        """encrypt_with_rsa on the executor so OAEP doesn't block the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.encrypt_with_rsa, data, public_key_pem)
+    
+    async def encrypt_many_with_rsa_async(self, payloads: Iterable[str], public_key_pem: str) -> list[str]:
+        """encrypt_many_with_rsa on the executor as a single job"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.encrypt_many_with_rsa, list(payloads), public_key_pem)
+    
+    async def _request(
+        self, endpoint: str, method: str, path: str, payload: Optional[Dict[str, Any]] = None, idempotent: bool = True
+    ) -> Dict[str, Any]:
+        """Send a request with the endpoint's timeout, retrying with exponential backoff
+
+        Non-idempotent calls are only retried when the request cannot have been
+        processed: the connection failed or the service shed it with 429 or 503.
+        """
+        import aiohttp
+        
+        session = self._get_session()
+        timeout = aiohttp.ClientTimeout(total=self.timeouts.get(endpoint))
+        endpoint_class = endpoint.split("_", 1)[0]
+        retry_statuses = RETRY_STATUSES if idempotent else SHED_STATUSES
+        with metrics.track("verifier_request", endpoint=endpoint):
+            for attempt in range(self.retries + 1):
+                last_attempt = attempt == self.retries
+                try:
+                    # Each attempt queues for a slot shared with every other caller of this endpoint class
+                    async with upstream_slot(self.base_url, endpoint_class) as slot:
+                        async with session.request(method, f"{self.base_url}{path}", json=payload, timeout=timeout) as response:
+                            if response.status in OVERLOAD_STATUSES:
+                                slot.overloaded(parse_retry_after(response.headers.get("Retry-After")))
+                            if response.status not in retry_statuses or last_attempt:
+                                return await response.json(content_type=None)
+                except aiohttp.ClientConnectorError:
+                    if last_attempt:
+                        raise
+                except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError):
+                    if last_attempt or not idempotent:
+                        raise
+                metrics.inc("verifier_retries_total", endpoint=endpoint)
+                await asyncio.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
     
     async def health_check(self) -> Dict[str, Any]:
         """Check service health"""
-        async with self.session.get(f"{self.base_url}/health") as response:
-            return await response.json()
+        return await self._request("health", "GET", "/health")
     
     async def register_options(self) -> Dict[str, Any]:
         """Get registration options"""
-        async with self.session.post(f"{self.base_url}/aptos/register/options") as response:
-            return await response.json()
+        return await self._request("register_options", "POST", "/aptos/register/options")
     
     async def register_verify(self, payload: Dict[str, Any], signature: str) -> Dict[str, Any]:
         """Register pot with 1P configuration"""
@@ -298,11 +1481,9 @@ class VerifierServiceClient:
             "payload": payload,
             "signature": signature
         }
-        async with self.session.post(
-            f"{self.base_url}/aptos/register/verify",
-            json=request_payload
-        ) as response:
-            return await response.json()
+        return await self._request(
+            "register_verify", "POST", "/aptos/register/verify", request_payload, idempotent=False
+        )
     
     async def authenticate_options(self, attempt_id: str, signature: str) -> Dict[str, Any]:
         """Get authentication challenges"""
@@ -310,11 +1491,7 @@ class VerifierServiceClient:
             "payload": {"attempt_id": attempt_id, "signature": signature},
             "public_key": signature  # The endpoint expects public_key field
         }
-        async with self.session.post(
-            f"{self.base_url}/aptos/authenticate/options",
-            json=payload
-        ) as response:
-            return await response.json()
+        return await self._request("authenticate_options", "POST", "/aptos/authenticate/options", payload)
     
     async def authenticate_verify(self, solutions: list, challenge_id: str) -> Dict[str, Any]:
         """Verify authentication solution"""
@@ -322,11 +1499,26 @@ class VerifierServiceClient:
             "solutions": solutions,
             "challenge_id": challenge_id
         }
-        async with self.session.post(
-            f"{self.base_url}/aptos/authenticate/verify",
-            json=payload
-        ) as response:
-            return await response.json()
+        return await self._request(
+            "authenticate_verify", "POST", "/aptos/authenticate/verify", payload, idempotent=False
+        )
+
+class PotSpec(NamedTuple):
+    """Parameters for one pot in a bulk creation"""
+    amount: int
+    duration_seconds: int
+    fee: int
+    one_fa_address: AccountAddress
+
+
+class PotCreationResult(NamedTuple):
+    """Outcome of creating and registering one pot"""
+    spec: PotSpec
+    pot_id: Optional[int] = None
+    tx_hash: Optional[str] = None
+    registration: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
 
 class MoneyPotApp:
     """Main application class for Money Pot flow"""
@@ -340,23 +1532,37 @@ class MoneyPotApp:
         self.directions = None
         self.password = None
         self.legend = None
+        self.solver = None
     
-    async def initialize(self):
-        """Initialize the application"""
+    async def initialize(
+        self,
+        node_url: Union[str, list[str]] = NODE_URLS,
+        auth_url: str = MONEY_AUTH_URL,
+        node: Optional[AsyncRestClient] = None,
+        verifier: Optional[VerifierServiceClient] = None,
+    ):
+        """Initialize the application
+
+        `node` and `verifier` replace the clients built from the URLs, e.g.
+        with the recording and replaying clients in replay.py.
+        """
         print("🚀 Initializing Money Pot Application...")
+        await metrics.start()
         
-        # Initialize Aptos client
-        self.client = AsyncRestClient(NODE_URL)
+        # Initialize Aptos client, caching view results in front of the node(s)
+        self.client = CachingViewClient(node if node is not None else node_client(node_url))
         
-        # Load accounts from environment
-        self.creator_account = load_main_account_from_env()
-        self.hunter_account = load_hunter_account_from_env()
+        # Load accounts from environment unless they were provided
+        if self.creator_account is None:
+            self.creator_account = load_main_account_from_env()
+        if self.hunter_account is None:
+            self.hunter_account = load_hunter_account_from_env()
         
         print(f"✅ Creator account: {self.creator_account.account_address}")
         print(f"✅ Hunter account: {self.hunter_account.account_address}")
         
         # Initialize verifier service client
-        self.verifier = VerifierServiceClient(MONEY_AUTH_URL)
+        self.verifier = verifier if verifier is not None else VerifierServiceClient(auth_url)
         
         # Check verifier service health and get configuration
         async with self.verifier as verifier:
@@ -382,6 +1588,7 @@ class MoneyPotApp:
                 "yellow": self.directions.get("right", "R")
             }
             print(f"✅ Legend: {self.legend}")
+            self.solver = ChallengeSolver(self.legend)
 
             # Store direction mappings for later use
             self.direction_mappings = self.directions
@@ -392,18 +1599,21 @@ class MoneyPotApp:
         
         # Step 1: Create pot on blockchain
         print("1. Creating pot on blockchain...")
-        create_tx_hash = await create_pot(
-            self.client, 
-            self.creator_account, 
-            amount, 
-            duration_seconds, 
-            fee, 
-            self.hunter_account.account_address  # Use hunter as 1FA address
+        create_receipt = await submit_transaction_receipt(
+            self.client,
+            self.creator_account,
+            create_pot_payload(
+                amount,
+                duration_seconds,
+                fee,
+                self.hunter_account.account_address  # Use hunter as 1FA address
+            ),
         )
-        print(f"   Transaction: {create_tx_hash}")
+        print(f"   Transaction: {create_receipt.hash}")
         
-        # Extract pot_id from events
-        create_events = await get_transaction_events(self.client, create_tx_hash)
+        # Extract pot_id from the receipt's events
+        create_events = create_receipt.events
+        self.client.apply_events(create_events)
         pot_id = extract_pot_id_from_events(create_events)
         if pot_id is None:
             raise RuntimeError("Could not extract pot_id from creation events")
@@ -417,15 +1627,7 @@ class MoneyPotApp:
             print(f"   ✅ Got registration options")
             
             # Create 1P configuration payload
-            current_time = int(asyncio.get_event_loop().time())
-            payload = {
-                "pot_id": str(pot_id),
-                "1p": self.password,  # Dynamic password
-                "legend": self.legend,  # Dynamic legend from register options
-                "iat": current_time,
-                "iss": str(self.creator_account.account_address),
-                "exp": current_time + 3600
-            }
+            payload = self.registration_payload(pot_id)
             
             # Create signature for verification (simplified for MVP)
             signature = "mock_signature"  # Simplified for MVP
@@ -435,24 +1637,99 @@ class MoneyPotApp:
         
         return pot_id
     
-    async def hunt_pot_flow(self, pot_id: str):
-        """Complete treasure hunting flow"""
+    def registration_payload(self, pot_id: int) -> Dict[str, Any]:
+        """1P configuration payload registered with the verifier for a pot"""
+        current_time = int(time.time())
+        return {
+            "pot_id": str(pot_id),
+            "1p": self.password,  # Dynamic password
+            "legend": self.legend,  # Dynamic legend from register options
+            "iat": current_time,
+            "iss": str(self.creator_account.account_address),
+            "exp": current_time + 3600
+        }
+    
+    async def create_pots_bulk(
+        self, specs: list[PotSpec], max_in_flight: int = 16, register_concurrency: int = 16
+    ) -> list[PotCreationResult]:
+        """Create and register many pots, pipelining submission, decoding and registration
+
+        Creations are submitted through one TransactionSubmitter; as each commits
+        its pot_id is read from the committed transaction's events and the pot is
+        registered with the legend from ``initialize``, so no per-pot or
+        per-batch register_options call is needed. Results come back in spec
+        order, with per-pot errors instead of raising.
+        """
+        print(f"\n📦 Creating {len(specs)} Money Pots...")
+        submitter = TransactionSubmitter(self.client, self.creator_account, max_in_flight)
+        register_slots = asyncio.Semaphore(register_concurrency)
+
+        async def finish(spec: PotSpec, future: asyncio.Future) -> PotCreationResult:
+            tx_hash = None
+            pot_id = None
+            try:
+                receipt = await future
+                tx_hash = receipt.hash
+                if not receipt.success:
+                    raise RuntimeError(f"Transaction failed: {receipt.vm_status}")
+                self.client.apply_events(receipt.events)
+                pot_id = extract_pot_id_from_events(receipt.events)
+                if pot_id is None:
+                    raise RuntimeError("Could not extract pot_id from creation events")
+                async with register_slots:
+                    registration = await self.verifier.register_verify(
+                        self.registration_payload(pot_id), "mock_signature"
+                    )
+                return PotCreationResult(spec, pot_id, tx_hash, registration)
+            except Exception as e:
+                return PotCreationResult(spec, pot_id, tx_hash, error=str(e))
+
+        tasks = []
+        for spec in specs:
+            payload = create_pot_payload(spec.amount, spec.duration_seconds, spec.fee, spec.one_fa_address)
+            try:
+                future = await submitter.submit(payload)
+            except Exception as e:
+                failed = asyncio.get_running_loop().create_future()
+                failed.set_exception(e)
+                future = failed
+            tasks.append(asyncio.create_task(finish(spec, future)))
+
+        results = await asyncio.gather(*tasks)
+        created = sum(1 for result in results if result.error is None)
+        print(f"   ✅ Created and registered {created}/{len(specs)} pots")
+        return list(results)
+    
+    async def hunt_pot_flow(self, pot_id: str, timings: Optional[Dict[str, float]] = None):
+        """Complete treasure hunting flow
+
+        When `timings` is given it is filled with the seconds spent in each
+        phase: attempt, authenticate_options, solve and authenticate_verify.
+        """
+        if timings is None:
+            timings = {}
         print(f"\n🎯 Hunting Pot {pot_id}...")
         
         # Step 1: Attempt pot on blockchain
         print("1. Attempting pot on blockchain...")
-        attempt_tx_hash = await attempt_pot(self.client, self.hunter_account, int(pot_id))
-        print(f"   Transaction: {attempt_tx_hash}")
+        started = time.perf_counter()
+        attempt_receipt = await submit_transaction_receipt(
+            self.client, self.hunter_account, attempt_pot_payload(int(pot_id))
+        )
+        print(f"   Transaction: {attempt_receipt.hash}")
         
-        # Extract attempt_id from events
-        attempt_events = await get_transaction_events(self.client, attempt_tx_hash)
+        # Extract attempt_id from the receipt's events
+        attempt_events = attempt_receipt.events
+        self.client.apply_events(attempt_events)
         attempt_id = extract_attempt_id_from_events(attempt_events)
         if attempt_id is None:
             raise RuntimeError("Could not extract attempt_id from attempt events")
         print(f"   ✅ Attempt ID: {attempt_id}")
+        timings["attempt"] = time.perf_counter() - started
         
         # Step 2: Get authentication challenges
         print("2. Getting authentication challenges...")
+        started = time.perf_counter()
         async with self.verifier as verifier:
             # Use hunter's address as the signature since that's what was used in pot creation
             hunter_address = str(self.hunter_account.account_address)
@@ -461,6 +1738,7 @@ class MoneyPotApp:
             # Use the address directly as the signature
             hunter_signature = hunter_address
             auth_options = await verifier.authenticate_options(str(attempt_id), hunter_signature)
+            timings["authenticate_options"] = time.perf_counter() - started
             print(f"   ✅ Got {len(auth_options.get('challenges', []))} challenges")
 
             # Update color and direction mappings from authenticate response if available
@@ -473,6 +1751,7 @@ class MoneyPotApp:
                 print(f"   ✅ Updated directions from authenticate: {self.directions}")
             
             # Step 3: Solve challenges based on strategy
+            started = time.perf_counter()
             print("3. Solving challenges...")
             # Use direction mappings from the API
             DIRECTIONS = [
@@ -493,43 +1772,21 @@ class MoneyPotApp:
 
             if strategy == "random":
                 # Random strategy: generate random solutions
-                import random
                 solutions = [random.choice(DIRECTIONS) for _ in range(len(challenges))]
                 print(f"   Random solutions: {solutions}")
             else:
                 # Intelligent strategy: solve based on color groups and legend
-                # We know the password is "A" and use the legend from initialization
-                password = self.password
-                legend = self.legend  # Use the legend we created during initialization
-                
-                for i, challenge in enumerate(challenges):
-                    print(f"   Challenge {i+1}: {challenge}")
-                    
-                    # Get the color groups for this challenge
-                    color_groups = challenge.get('colorGroups', {})
-                    
-                    # Find which color group contains our password character
-                    password_color = None
-                    for color, chars in color_groups.items():
-                        if password in chars:
-                            password_color = color
-                            break
-                    
-                    if password_color:
-                        # Map color to direction using our legend
-                        direction = legend.get(password_color, "S")
-                        solutions.append(direction)
-                        print(f"   Password '{password}' is in {password_color} group -> {direction}")
-                    else:
-                        # Fallback to Skip if password not found
-                        solutions.append("S")
-                        print(f"   Password '{password}' not found in color groups -> Skip")
+                # We know the password and use the legend from initialization
+                solutions = self.solver.solve(challenges, self.password)
             
             print(f"   Solutions: {solutions}")
+            timings["solve"] = time.perf_counter() - started
             
             # Step 4: Verify solutions
             print("4. Verifying solutions...")
+            started = time.perf_counter()
             verify_result = await verifier.authenticate_verify(solutions, str(attempt_id))
+            timings["authenticate_verify"] = time.perf_counter() - started
             print(f"   ✅ Authentication result: {verify_result}")
         
         return attempt_id
@@ -556,8 +1813,15 @@ class MoneyPotApp:
             traceback.print_exc()
         
         finally:
-            if self.client:
-                await self.client.close()
+            await self.close()
+    
+    async def close(self):
+        """Close the node client and the verifier's connection pool"""
+        if self.client:
+            await self.client.close()
+        if self.verifier:
+            await self.verifier.close()
+        await metrics.close()
 
 async def main():
     """Main entry point"""
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Money Pot Offline Benchmarks
+Runs the client paths against in-process fake fullnode and verifier services
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, Any
+
+from app import (
+    Account,
+    AsyncRestClient,
+    ChallengeSolver,
+    MoneyPotApp,
+    MultiNodeClient,
+    TransactionSubmitter,
+    VerifierServiceClient,
+    attempt_pot,
+    attempt_pot_payload,
+    entry_function_template,
+    create_pot,
+    get_pot,
+    get_pots_bulk,
+)
+from fakes import DEFAULT_LEGEND, FakeNode, FakeVerifier, Faults
+from loadgen import percentile
+
+# Benchmark configuration
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", "200"))
+NODE_LATENCY = float(os.getenv("BENCH_NODE_LATENCY_MS", "0")) / 1000
+VERIFIER_LATENCY = float(os.getenv("BENCH_VERIFIER_LATENCY_MS", "0")) / 1000
+ERROR_RATE = float(os.getenv("BENCH_ERROR_RATE", "0"))
+TRACE_ALLOCATIONS = os.getenv("BENCH_TRACE_ALLOCATIONS", "1") == "1"
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT")  # Optional JSON results file
+BENCH_SCENARIOS = [x for x in os.getenv("BENCH_SCENARIOS", "").split(",") if x]
+
+
+class BenchContext:
+    """Fake services plus clients and accounts shared by the scenarios"""
+
+    def __init__(self, node: FakeNode, verifier: FakeVerifier):
+        self.node = node
+        self.fake_verifier = verifier
+        self.client = AsyncRestClient(node.url)
+        self.creator = Account.generate()
+        self.hunter = Account.generate()
+        self.pot_id = 0
+
+    async def setup(self):
+        await create_pot(self.client, self.creator, 10000, 3600, 100, self.hunter.account_address)
+        self.pot_id = max(self.node.pots)
+
+    async def close(self):
+        await self.client.close()
+
+
+async def scenario_submit(ctx: BenchContext, n: int) -> list[float]:
+    """Sequential submit_transaction round-trips"""
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        await attempt_pot(ctx.client, ctx.hunter, ctx.pot_id)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def scenario_submit_pipelined(ctx: BenchContext, n: int) -> list[float]:
+    """TransactionSubmitter with many transactions in flight"""
+    submitter = TransactionSubmitter(ctx.client, ctx.hunter, max_in_flight=32)
+
+    async def one() -> float:
+        started = time.perf_counter()
+        await submitter.submit_and_wait(attempt_pot_payload(ctx.pot_id))
+        return time.perf_counter() - started
+
+    return list(await asyncio.gather(*(one() for _ in range(n))))
+
+
+async def scenario_view(ctx: BenchContext, n: int) -> list[float]:
+    """Sequential get_pot view calls"""
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        await get_pot(ctx.client, ctx.pot_id)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def scenario_view_bulk(ctx: BenchContext, n: int) -> list[float]:
+    """One get_pots_bulk call over n pot IDs, timed as a whole"""
+    # Seed the fake registry directly; only the read path is measured here
+    template = ctx.node.pots[ctx.pot_id]
+    for pot_id in range(1, n + 1):
+        ctx.node.pots.setdefault(pot_id, dict(template, id=pot_id))
+    started = time.perf_counter()
+    await get_pots_bulk(ctx.client, range(1, n + 1))
+    return [time.perf_counter() - started]
+
+
+async def scenario_view_hedged(ctx: BenchContext, n: int) -> list[float]:
+    """get_pot through a MultiNodeClient whose first node is slow"""
+    samples = []
+    async with ctx.node.replica(Faults(latency=0.1)) as slow:
+        client = MultiNodeClient([slow.url, ctx.node.url], hedge_after=0.01)
+        try:
+            for _ in range(n):
+                started = time.perf_counter()
+                await get_pot(client, ctx.pot_id)
+                samples.append(time.perf_counter() - started)
+        finally:
+            await client.close()
+    return samples
+
+
+async def scenario_submit_failover(ctx: BenchContext, n: int) -> list[float]:
+    """attempt_pot through a MultiNodeClient whose first node rejects every transaction"""
+    samples = []
+    broken_faults = Faults(overrides={"/v1/transactions": Faults(error_rate=1.0)})
+    async with ctx.node.replica(broken_faults) as broken:
+        client = MultiNodeClient([broken.url, ctx.node.url])
+        try:
+            for _ in range(n):
+                started = time.perf_counter()
+                await attempt_pot(client, ctx.hunter, ctx.pot_id)
+                samples.append(time.perf_counter() - started)
+        finally:
+            await client.close()
+    return samples
+
+
+async def scenario_verifier(ctx: BenchContext, n: int) -> list[float]:
+    """authenticate_options + authenticate_verify round-trips"""
+    samples = []
+    verifier = VerifierServiceClient(ctx.fake_verifier.url)
+    try:
+        for i in range(n):
+            started = time.perf_counter()
+            await verifier.authenticate_options(str(i), str(ctx.hunter.account_address))
+            await verifier.authenticate_verify(["S"], str(i))
+            samples.append(time.perf_counter() - started)
+    finally:
+        await verifier.close()
+    return samples
+
+
+async def scenario_solve(ctx: BenchContext, n: int) -> list[float]:
+    """ChallengeSolver.solve_batch over n challenge sets, timed per batch of 100"""
+    rng = random.Random(0)
+    solver = ChallengeSolver(DEFAULT_LEGEND)
+    batch = [([FakeVerifier.make_challenge(rng) for _ in range(10)], "AB7") for _ in range(100)]
+    samples = []
+    for _ in range(max(1, n // 100)):
+        started = time.perf_counter()
+        solver.solve_batch(batch)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def scenario_hunt(ctx: BenchContext, n: int) -> list[float]:
+    """Full MoneyPotApp create + hunt flow with output suppressed"""
+    app = MoneyPotApp()
+    app.creator_account = ctx.creator
+    app.hunter_account = ctx.hunter
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        await app.initialize(ctx.node.url, ctx.fake_verifier.url)
+        pot_id = await app.create_pot_flow(duration_seconds=3600)
+        for _ in range(n):
+            started = time.perf_counter()
+            await app.hunt_pot_flow(str(pot_id))
+            samples.append(time.perf_counter() - started)
+    await app.close()
+    return samples
+
+
+async def scenario_payloads(ctx: BenchContext, n: int) -> list[float]:
+    """Bulk attempt_completed payload encoding, timed per batch of 100"""
+    template = entry_function_template("attempt_completed")
+    rows = [(attempt_id, attempt_id % 2 == 0) for attempt_id in range(100)]
+    samples = []
+    for _ in range(max(1, n // 100)):
+        started = time.perf_counter()
+        template.payloads(rows)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+SCENARIOS: Dict[str, Callable[[BenchContext, int], Awaitable[list[float]]]] = {
+    "submit": scenario_submit,
+    "submit_pipelined": scenario_submit_pipelined,
+    "view": scenario_view,
+    "view_bulk": scenario_view_bulk,
+    "view_hedged": scenario_view_hedged,
+    "submit_failover": scenario_submit_failover,
+    "verifier": scenario_verifier,
+    "solve": scenario_solve,
+    "payloads": scenario_payloads,
+    "hunt": scenario_hunt,
+}
+
+
+async def run_scenario(ctx: BenchContext, name: str, n: int) -> Dict[str, Any]:
+    """Time a scenario, then re-run a short pass under tracemalloc for memory use
+
+    tracemalloc sees live memory, not allocation counts: ``alloc_peak_kib`` is
+    the pass's high-water mark and ``retained_per_op_kib`` the memory still
+    held after it (caches, pools, leaks) divided by its operations.
+    """
+    scenario = SCENARIOS[name]
+    errors = 0
+    started = time.perf_counter()
+    try:
+        samples = await scenario(ctx, n)
+    except Exception as e:
+        print(f"❌ {name}: {e}")
+        samples, errors = [], 1
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "scenario": name,
+        "iterations": n,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput_per_s": n / elapsed if elapsed and not errors else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+    if TRACE_ALLOCATIONS and not errors:
+        traced = max(1, n // 10)
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            await scenario(ctx, traced)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["alloc_peak_kib"] = peak / 1024
+        result["retained_per_op_kib"] = (current - before) / traced / 1024
+    return result
+
+
+def print_results(results: list[Dict[str, Any]]):
+    print(f"   {'scenario':<18} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KiB':>9} {'errors':>6}")
+    for r in results:
+        print(
+            f"   {r['scenario']:<18} {r['throughput_per_s']:>9.1f} {r['p50_ms']:>8.2f} "
+            f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r.get('alloc_peak_kib', 0):>9.1f} {r['errors']:>6}"
+        )
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Offline Benchmarks")
+    print("=" * 40)
+
+    node = FakeNode(Faults(latency=NODE_LATENCY, error_rate=ERROR_RATE))
+    verifier = FakeVerifier(Faults(latency=VERIFIER_LATENCY, error_rate=ERROR_RATE), node=node)
+    async with node, verifier:
+        ctx = BenchContext(node, verifier)
+        await ctx.setup()
+        results = []
+        for name in BENCH_SCENARIOS or SCENARIOS:
+            print(f"⏱️  {name}...")
+            results.append(await run_scenario(ctx, name, ITERATIONS))
+        await ctx.close()
+
+    print(f"\n📊 Results ({ITERATIONS} iterations)")
+    print_results(results)
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Wrote {BENCH_OUTPUT}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Money Pot Command Line
+Short-lived subcommands for cron jobs and shell scripts
+
+Each command imports only what it needs: the read commands talk to the
+fullnode through NodeViewClient and never load the Aptos SDK, aiohttp or
+cryptography. Results go to stdout (JSON lines for pots); progress output
+from the write flows goes to stderr.
+
+    python cli.py pots [--all] [--ids]
+    python cli.py pot POT_ID
+    python cli.py create [--amount N] [--duration SECONDS] [--fee N]
+    python cli.py hunt POT_ID
+    python cli.py settle ATTEMPT_ID {success,failure}
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+
+
+async def cmd_pots(args) -> int:
+    """List active pots, or every pot with --all"""
+    from app import NODE_URL, NodeViewClient, get_active_pots, get_pots, get_pots_bulk
+
+    client = NodeViewClient(NODE_URL)
+    try:
+        pot_ids = await (get_pots(client) if args.all else get_active_pots(client))
+        if args.ids:
+            for pot_id in pot_ids:
+                print(pot_id)
+            return 0
+        pots = await get_pots_bulk(client, pot_ids)
+    finally:
+        await client.close()
+    for pot_id in pot_ids:
+        print(json.dumps(pots[pot_id]._asdict()))
+    return 0
+
+
+async def cmd_pot(args) -> int:
+    """Print one pot as JSON"""
+    from app import NODE_URL, NodeViewClient, get_pots_bulk
+
+    client = NodeViewClient(NODE_URL)
+    try:
+        pots = await get_pots_bulk(client, [args.pot_id])
+    finally:
+        await client.close()
+    print(json.dumps(pots[args.pot_id]._asdict()))
+    return 0
+
+
+async def cmd_create(args) -> int:
+    """Create and register a pot, printing its ID"""
+    from app import MoneyPotApp
+
+    app = MoneyPotApp()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            await app.initialize()
+            pot_id = await app.create_pot_flow(args.amount, args.duration, args.fee)
+    finally:
+        await app.close()
+    print(pot_id)
+    return 0
+
+
+async def cmd_hunt(args) -> int:
+    """Attempt and solve a pot, printing the attempt ID"""
+    from app import MoneyPotApp
+
+    app = MoneyPotApp()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            await app.initialize()
+            attempt_id = await app.hunt_pot_flow(str(args.pot_id))
+    finally:
+        await app.close()
+    print(attempt_id)
+    return 0
+
+
+async def cmd_settle(args) -> int:
+    """Settle one attempt as the verifier oracle, printing the transaction hash"""
+    from app import attempt_completed, load_oracle_account_from_env, node_client
+
+    client = node_client()
+    try:
+        tx_hash = await attempt_completed(
+            client, load_oracle_account_from_env(), args.attempt_id, args.outcome == "success"
+        )
+    finally:
+        await client.close()
+    print(tx_hash)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="Money Pot command line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pots = commands.add_parser("pots", help="list active pots as JSON lines")
+    pots.add_argument("--all", action="store_true", help="include inactive pots")
+    pots.add_argument("--ids", action="store_true", help="print pot IDs only")
+    pots.set_defaults(handler=cmd_pots)
+
+    pot = commands.add_parser("pot", help="show one pot as JSON")
+    pot.add_argument("pot_id", type=int)
+    pot.set_defaults(handler=cmd_pot)
+
+    create = commands.add_parser("create", help="create and register a pot")
+    create.add_argument("--amount", type=int, default=10000)
+    create.add_argument("--duration", type=int, default=360, help="seconds until the pot expires")
+    create.add_argument("--fee", type=int, default=100)
+    create.set_defaults(handler=cmd_create)
+
+    hunt = commands.add_parser("hunt", help="attempt and solve a pot")
+    hunt.add_argument("pot_id", type=int)
+    hunt.set_defaults(handler=cmd_hunt)
+
+    settle = commands.add_parser("settle", help="settle an attempt as the oracle")
+    settle.add_argument("attempt_id", type=int)
+    settle.add_argument("outcome", choices=("success", "failure"))
+    settle.set_defaults(handler=cmd_settle)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Main entry point"""
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(args.handler(args))
+    except Exception as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Money Pot Fake Services
+In-process stand-ins for the Aptos fullnode REST API and the verifier service,
+with configurable latency and error injection
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import string
+import time
+from typing import Optional, Dict, Any
+
+from aiohttp import web
+
+from app import (
+    MODULE_QN,
+    POT_EVENT_TYPE,
+    SignedTransaction,
+)
+from aptos_sdk.bcs import Deserializer
+
+CHAIN_ID = 4
+COLORS = {"red": "#ef4444", "green": "#22c55e", "blue": "#3b82f6", "yellow": "#eab308"}
+DIRECTIONS = {"up": "U", "down": "D", "left": "L", "right": "R", "skip": "S"}
+DEFAULT_LEGEND = {"red": "U", "green": "D", "blue": "L", "yellow": "R"}
+CHALLENGE_ALPHABET = string.ascii_uppercase + string.digits
+
+# Framework entry functions the clients call: (type arguments, BCS argument byte lengths)
+FRAMEWORK_SIGNATURES = {
+    ("aptos_account", "create_account"): ((), (32,)),
+    ("aptos_account", "transfer"): ((), (32, 8)),
+    # transfer<T: key>(&signer, metadata: Object<T>, recipient: address, amount: u64)
+    ("primary_fungible_store", "transfer"): (("0x1::fungible_asset::Metadata",), (32, 32, 8)),
+}
+
+
+class Faults:
+    """Latency and error injection for a fake service
+
+    ``overrides`` maps a path prefix to a Faults instance used for matching
+    requests instead of this one.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        overrides: Optional[Dict[str, "Faults"]] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.overrides = overrides or {}
+
+    def for_path(self, path: str) -> "Faults":
+        for prefix, faults in self.overrides.items():
+            if path.startswith(prefix):
+                return faults
+        return self
+
+    async def apply(self) -> Optional[web.Response]:
+        """Sleep for the configured latency and maybe return an injected error"""
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            return web.json_response(
+                {"message": "injected fault", "error_code": "injected"}, status=self.error_status
+            )
+        return None
+
+
+def _not_client_disconnect(record: logging.LogRecord) -> bool:
+    # Hedged and cancelled calls drop their connections mid-response on purpose
+    return not (record.exc_info and isinstance(record.exc_info[1], ConnectionResetError))
+
+
+logging.getLogger("aiohttp.server").addFilter(_not_client_disconnect)
+
+
+class FakeServer:
+    """Runs an aiohttp application on an ephemeral localhost port"""
+
+    def __init__(self, faults: Optional[Faults] = None):
+        self.faults = faults or Faults()
+        self.requests = 0
+        self.app = web.Application(middlewares=[self._fault_middleware])
+        self.runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    @web.middleware
+    async def _fault_middleware(self, request: web.Request, handler):
+        self.requests += 1
+        injected = await self.faults.for_path(request.path).apply()
+        if injected is not None:
+            return injected
+        return await handler(request)
+
+    async def start(self) -> str:
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self.runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+
+def _u64(arg: bytes) -> int:
+    return int.from_bytes(arg, "little")
+
+
+def _type_tag_name(tag) -> str:
+    # The SDK prints special addresses either short or in full; compare them short
+    address, rest = str(tag).split("::", 1)
+    return f"0x{int(address, 16):x}::{rest}"
+
+
+class FakeLedger:
+    """Chain state served by a FakeNode; replicas of a node share one ledger"""
+
+    def __init__(self):
+        self.version = 0
+        self.sequence_numbers: Dict[str, int] = {}
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.pots: Dict[int, Dict[str, Any]] = {}
+        self.attempts: Dict[int, Dict[str, Any]] = {}
+        self.events: list[Dict[str, Any]] = []
+
+
+class FakeNode(FakeServer):
+    """Fake Aptos fullnode that executes money_pot_manager entry functions in memory
+
+    Transactions commit as soon as they are accepted; signatures are not checked.
+    ``url`` is the REST base, including the ``/v1`` prefix.
+    """
+
+    def __init__(self, faults: Optional[Faults] = None, difficulty: int = 3, ledger: Optional[FakeLedger] = None):
+        super().__init__(faults)
+        self.difficulty = difficulty
+        self.ledger = ledger or FakeLedger()
+        self.sequence_numbers = self.ledger.sequence_numbers
+        self.transactions = self.ledger.transactions
+        self.pots = self.ledger.pots
+        self.attempts = self.ledger.attempts
+        self.events = self.ledger.events
+        self.app.add_routes([
+            web.get("/v1", self.ledger_info),
+            web.get("/v1/", self.ledger_info),
+            web.get("/v1/accounts/{address}", self.account),
+            web.get("/v1/accounts/{address}/transactions", self.account_transactions),
+            web.post("/v1/transactions", self.submit),
+            web.get("/v1/transactions/by_hash/{hash}", self.transaction_by_hash),
+            web.get("/v1/transactions/wait_by_hash/{hash}", self.transaction_by_hash),
+            web.post("/v1/view", self.view),
+            web.get("/v1/accounts/{address}/events/{handle}/{field}", self.events_by_handle),
+        ])
+
+    async def start(self) -> str:
+        await super().start()
+        self.url = f"{self.url}/v1"
+        return self.url
+
+    def replica(self, faults: Optional[Faults] = None) -> "FakeNode":
+        """Another fullnode serving the same ledger, e.g. for multi-node clients"""
+        return FakeNode(faults, self.difficulty, self.ledger)
+
+    @staticmethod
+    def _error(status: int, error_code: str, message: str) -> web.Response:
+        return web.json_response({"message": message, "error_code": error_code}, status=status)
+
+    async def ledger_info(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "chain_id": CHAIN_ID,
+            "epoch": "1",
+            "ledger_version": str(self.ledger.version),
+            "oldest_ledger_version": "0",
+            "ledger_timestamp": str(int(time.time() * 1_000_000)),
+            "node_role": "full_node",
+            "block_height": str(self.ledger.version),
+        })
+
+    async def account(self, request: web.Request) -> web.Response:
+        address = request.match_info["address"]
+        return web.json_response({
+            "sequence_number": str(self.sequence_numbers.get(address, 0)),
+            "authentication_key": address,
+        })
+
+    async def submit(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        try:
+            signed = SignedTransaction.deserialize(Deserializer(body))
+        except Exception as e:
+            return self._error(400, "invalid_input", f"could not decode transaction: {e}")
+
+        raw = signed.transaction
+        sender = str(raw.sender)
+        expected = self.sequence_numbers.get(sender, 0)
+        if raw.sequence_number < expected:
+            return self._error(400, "vm_error", "Invalid transaction: Type: Validation Code: SEQUENCE_NUMBER_TOO_OLD")
+        if raw.sequence_number > expected:
+            return self._error(400, "vm_error", "Invalid transaction: Type: Validation Code: SEQUENCE_NUMBER_TOO_NEW")
+        self.sequence_numbers[sender] = expected + 1
+
+        tx_hash = "0x" + hashlib.sha3_256(body).hexdigest()
+        self.ledger.version += 1
+        entry = raw.payload.value
+        type_args = [_type_tag_name(tag) for tag in entry.ty_args]
+        success, events = self._execute(sender, entry.module.name, entry.function, type_args, entry.args)
+        self.transactions[tx_hash] = {
+            "type": "user_transaction",
+            "version": str(self.ledger.version),
+            "hash": tx_hash,
+            "sender": sender,
+            "sequence_number": str(raw.sequence_number),
+            "success": success,
+            "vm_status": "Executed successfully" if success else "Move abort",
+            "gas_used": str(8 + 4 * len(events)),
+            "gas_unit_price": str(raw.gas_unit_price),
+            "timestamp": str(int(time.time() * 1_000_000)),
+            "events": events,
+        }
+        return web.json_response({"hash": tx_hash}, status=202)
+
+    def _emit(self, event_type: str, item_id: int, actor: str) -> Dict[str, Any]:
+        event = {
+            "version": str(self.ledger.version),
+            "guid": {"creation_number": "0", "account_address": MODULE_QN.split("::")[0]},
+            "sequence_number": str(len(self.events)),
+            "type": POT_EVENT_TYPE,
+            "data": {
+                "id": str(item_id),
+                "event_type": "0x" + event_type.encode().hex(),
+                "timestamp": str(int(time.time())),
+                "actor": actor,
+            },
+        }
+        self.events.append(event)
+        return event
+
+    def _execute(self, sender: str, module: str, function: str, type_args: list[str], args: list[bytes]) -> tuple[bool, list]:
+        """Run an entry function against the in-memory registry"""
+        now = int(time.time())
+        if module != "money_pot_manager":
+            # Framework calls have no effect here, but abort like the VM on a bad signature
+            signature = FRAMEWORK_SIGNATURES.get((module, function))
+            if signature is None:
+                return False, []
+            expected_type_args, arg_lengths = signature
+            return tuple(type_args) == expected_type_args and tuple(len(arg) for arg in args) == arg_lengths, []
+
+        if function == "create_pot_entry":
+            amount, duration, fee = _u64(args[0]), _u64(args[1]), _u64(args[2])
+            pot_id = len(self.pots) + 1
+            self.pots[pot_id] = {
+                "id": pot_id,
+                "creator": sender,
+                "total_amount": amount,
+                "fee": fee,
+                "created_at": now,
+                "expires_at": now + duration,
+                "is_active": True,
+                "attempts_count": 0,
+                "one_fa_address": "0x" + args[3].hex(),
+                "token": "0xa",
+            }
+            return True, [self._emit("created", pot_id, sender)]
+
+        if function == "attempt_pot_entry":
+            pot = self.pots.get(_u64(args[0]))
+            if pot is None or not pot["is_active"]:
+                return False, []
+            attempt_id = len(self.attempts) + 1
+            pot["attempts_count"] += 1
+            self.attempts[attempt_id] = {
+                "id": attempt_id,
+                "pot_id": pot["id"],
+                "hunter": sender,
+                "expires_at": now + 300,
+                "difficulty": self.difficulty,
+                "is_completed": False,
+            }
+            return True, [self._emit("attempted", attempt_id, sender)]
+
+        if function == "attempt_completed":
+            attempt = self.attempts.get(_u64(args[0]))
+            if attempt is None or attempt["is_completed"]:
+                return False, []
+            attempt["is_completed"] = True
+            if args[1] == b"\x01":
+                pot = self.pots[attempt["pot_id"]]
+                pot["total_amount"] -= pot["total_amount"] * 40 // 100
+            return True, [self._emit("completed", attempt["id"], sender)]
+
+        if function == "expire_pot":
+            pot = self.pots.get(_u64(args[0]))
+            if pot is None or not pot["is_active"] or pot["expires_at"] > now:
+                return False, []
+            pot["is_active"] = False
+            return True, [self._emit("expired", pot["id"], sender)]
+
+        return False, []
+
+    async def account_transactions(self, request: web.Request) -> web.Response:
+        address = request.match_info["address"]
+        start = int(request.query.get("start", 0))
+        limit = int(request.query.get("limit", 25))
+        sent = sorted(
+            (tx for tx in self.transactions.values() if tx["sender"] == address and int(tx["sequence_number"]) >= start),
+            key=lambda tx: int(tx["sequence_number"]),
+        )
+        return web.json_response(sent[:limit])
+
+    async def transaction_by_hash(self, request: web.Request) -> web.Response:
+        tx = self.transactions.get(request.match_info["hash"])
+        if tx is None:
+            return self._error(404, "transaction_not_found", "Transaction not found")
+        return web.json_response(tx)
+
+    @staticmethod
+    def _view_value(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v if isinstance(v, (bool, str)) else str(v) for k, v in record.items()}
+
+    async def view(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        name = body["function"].rsplit("::", 1)[-1]
+        args = body.get("arguments", [])
+
+        if name == "get_pots":
+            return web.json_response([[str(pot_id) for pot_id in self.pots]])
+        if name == "get_active_pots":
+            return web.json_response([[str(pot_id) for pot_id, pot in self.pots.items() if pot["is_active"]]])
+        if name in ("get_pot", "get_attempt"):
+            records = self.pots if name == "get_pot" else self.attempts
+            record = records.get(int(args[0]))
+            if record is None:
+                return self._error(400, "invalid_input", f"{name}: not found")
+            return web.json_response([self._view_value(record)])
+        if name in ("get_token", "get_resource_address", "get_verifier_oracle"):
+            return web.json_response(["0xa"])
+        if name == "get_balance":
+            return web.json_response(["0"])
+        return self._error(400, "invalid_input", f"unknown view function {body['function']}")
+
+    async def events_by_handle(self, request: web.Request) -> web.Response:
+        start = int(request.query.get("start", 0))
+        limit = int(request.query.get("limit", 25))
+        return web.json_response(self.events[start:start + limit])
+
+
+class FakeVerifier(FakeServer):
+    """Emulator of the verifier's /health, /aptos/register/* and /aptos/authenticate/* endpoints
+
+    When linked to a FakeNode, challenges follow the password and legend
+    registered for the attempt's pot; otherwise "A" and the default legend.
+    """
+
+    def __init__(self, faults: Optional[Faults] = None, node: Optional[FakeNode] = None, challenges: int = 3):
+        super().__init__(faults)
+        self.node = node
+        self.challenges = challenges
+        self.registrations: Dict[str, Dict[str, Any]] = {}
+        self.expected: Dict[str, list[str]] = {}
+        self.app.add_routes([
+            web.get("/health", self.health),
+            web.post("/aptos/register/options", self.register_options),
+            web.post("/aptos/register/verify", self.register_verify),
+            web.post("/aptos/authenticate/options", self.authenticate_options),
+            web.post("/aptos/authenticate/verify", self.authenticate_verify),
+        ])
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "healthy"})
+
+    async def register_options(self, request: web.Request) -> web.Response:
+        return web.json_response({"colors": COLORS, "directions": DIRECTIONS})
+
+    async def register_verify(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        payload = body.get("payload", {})
+        self.registrations[str(payload.get("pot_id"))] = payload
+        return web.json_response({"success": True, "pot_id": payload.get("pot_id")})
+
+    def _registration_for(self, attempt_id: str) -> Dict[str, Any]:
+        if self.node is not None:
+            attempt = self.node.attempts.get(int(attempt_id))
+            if attempt is not None:
+                return self.registrations.get(str(attempt["pot_id"]), {})
+        return {}
+
+    @staticmethod
+    def make_challenge(rng: random.Random) -> Dict[str, Any]:
+        chars = list(CHALLENGE_ALPHABET)
+        rng.shuffle(chars)
+        groups = {color: chars[i::len(COLORS)] for i, color in enumerate(COLORS)}
+        return {"grid": "".join(chars), "colorGroups": groups}
+
+    async def authenticate_options(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        attempt_id = str(body.get("payload", {}).get("attempt_id"))
+        registration = self._registration_for(attempt_id)
+        password = registration.get("1p", "A")
+        legend = registration.get("legend", DEFAULT_LEGEND)
+
+        rng = random.Random(attempt_id)
+        challenges, expected = [], []
+        for i in range(self.challenges):
+            challenge = self.make_challenge(rng)
+            char = password[i % len(password)]
+            color = next(color for color, chars in challenge["colorGroups"].items() if char in chars)
+            challenges.append(challenge)
+            expected.append(legend.get(color, "S"))
+        self.expected[attempt_id] = expected
+        return web.json_response({
+            "challenges": challenges,
+            "challenge_id": attempt_id,
+            "colors": COLORS,
+            "directions": DIRECTIONS,
+        })
+
+    async def authenticate_verify(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        challenge_id = str(body.get("challenge_id"))
+        expected = self.expected.pop(challenge_id, None)
+        if expected is None:
+            return web.json_response({"success": False, "error": "unknown challenge"}, status=404)
+        return web.json_response({"success": body.get("solutions") == expected})
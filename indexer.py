@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Money Pot Event Indexer
+Streams money_pot_manager::PotEvent records from the node into a local SQLite store
+"""
+
+import asyncio
+import os
+import sqlite3
+from typing import Dict, Any, Iterable
+
+from app import (
+    AsyncRestClient,
+    Attempt,
+    MoneyPot,
+    MODULE_ADDR,
+    MODULE_QN,
+    decode_pot_events,
+    get_attempts_bulk,
+    get_pots_bulk,
+    node_client,
+)
+from metrics import metrics
+
+INDEXER_DB = os.getenv("INDEXER_DB", "money_pot_index.db")
+REGISTRY_ADDR = os.getenv("MONEY_POT_REGISTRY_ADDRESS", MODULE_ADDR)
+INDEXER_MAX_BACKOFF_SECONDS = float(os.getenv("INDEXER_MAX_BACKOFF_SECONDS", "60"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    sequence_number INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    actor TEXT NOT NULL,
+    timestamp INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_item_id ON events (event_type, item_id);
+
+CREATE TABLE IF NOT EXISTS pots (
+    id INTEGER PRIMARY KEY,
+    creator TEXT NOT NULL,
+    total_amount INTEGER NOT NULL,
+    fee INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER NOT NULL,
+    is_active INTEGER NOT NULL,
+    attempts_count INTEGER NOT NULL,
+    one_fa_address TEXT NOT NULL,
+    token TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pots_creator ON pots (creator);
+CREATE INDEX IF NOT EXISTS pots_expires_at ON pots (expires_at);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    pot_id INTEGER NOT NULL,
+    hunter TEXT NOT NULL,
+    expires_at INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    is_completed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_pot_id ON attempts (pot_id);
+CREATE INDEX IF NOT EXISTS attempts_hunter ON attempts (hunter);
+CREATE INDEX IF NOT EXISTS attempts_expires_at ON attempts (expires_at);
+
+CREATE TABLE IF NOT EXISTS cursor (
+    name TEXT PRIMARY KEY,
+    next_sequence_number INTEGER NOT NULL
+);
+"""
+
+
+class PotStore:
+    """SQLite store for indexed pots, attempts and events"""
+
+    def __init__(self, path: str = INDEXER_DB):
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def get_cursor(self, name: str = "pot_events") -> int:
+        row = self.db.execute("SELECT next_sequence_number FROM cursor WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def write_batch(
+        self,
+        events: list[tuple],
+        pots: Iterable[MoneyPot],
+        attempts: Iterable[Attempt],
+        next_sequence_number: int,
+        name: str = "pot_events",
+    ):
+        """Write one page of events and refreshed records, advancing the cursor atomically"""
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)", events)
+            self.db.executemany("INSERT OR REPLACE INTO pots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", pots)
+            self.db.executemany("INSERT OR REPLACE INTO attempts VALUES (?, ?, ?, ?, ?, ?)", attempts)
+            self.db.execute(
+                "INSERT OR REPLACE INTO cursor VALUES (?, ?)", (name, next_sequence_number)
+            )
+
+    def attempts_by_hunter(self, hunter: str) -> list[sqlite3.Row]:
+        return self.db.execute(
+            "SELECT * FROM attempts WHERE hunter = ? ORDER BY id", (hunter,)
+        ).fetchall()
+
+    def attempts_for_pot(self, pot_id: int) -> list[sqlite3.Row]:
+        return self.db.execute(
+            "SELECT * FROM attempts WHERE pot_id = ? ORDER BY id", (pot_id,)
+        ).fetchall()
+
+    def pots_by_creator(self, creator: str) -> list[sqlite3.Row]:
+        return self.db.execute(
+            "SELECT * FROM pots WHERE creator = ? ORDER BY id", (creator,)
+        ).fetchall()
+
+    def pots_expiring_between(self, start: int, end: int) -> list[sqlite3.Row]:
+        """Active pots whose expires_at falls in [start, end)"""
+        return self.db.execute(
+            "SELECT * FROM pots WHERE is_active = 1 AND expires_at >= ? AND expires_at < ? ORDER BY expires_at",
+            (start, end),
+        ).fetchall()
+
+
+async def get_pot_events(client: AsyncRestClient, start: int, limit: int) -> list[Dict[str, Any]]:
+    """Fetch a page of PotEvents from the registry's event handle"""
+    return await client.events_by_handle(REGISTRY_ADDR, f"{MODULE_QN}::Registry", "events", start, limit)
+
+
+class PotEventIndexer:
+    """Incrementally indexes PotEvents, refreshing the pots and attempts they touch"""
+
+    def __init__(self, client: AsyncRestClient, store: PotStore, page_size: int = 100, concurrency: int = 32):
+        self.client = client
+        self.store = store
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+    async def index_page(self) -> int:
+        """Index the next page of events and return how many were read"""
+        start = self.store.get_cursor()
+        raw_events = await get_pot_events(self.client, start, self.page_size)
+        if not raw_events:
+            return 0
+
+        events = decode_pot_events(raw_events)
+        rows = [
+            (event.sequence_number, event.version, event.event_type, event.id, event.actor, event.timestamp)
+            for event in events
+        ]
+        pot_ids = {event.id for event in events if event.event_type in ("created", "expired")}
+        attempt_ids = {event.id for event in events if event.event_type in ("attempted", "completed")}
+
+        attempts = await get_attempts_bulk(self.client, attempt_ids, self.concurrency)
+        pot_ids.update(attempt.pot_id for attempt in attempts.values())
+        pots = await get_pots_bulk(self.client, pot_ids, self.concurrency)
+
+        next_sequence_number = int(raw_events[-1]["sequence_number"]) + 1
+        self.store.write_batch(rows, pots.values(), attempts.values(), next_sequence_number)
+        return len(raw_events)
+
+    async def run(self, poll_interval: float = 2.0):
+        """Index forever, sleeping only once caught up with the chain
+
+        Any error (node, transport or a failing bulk lookup) is logged and
+        the same page is retried after a backoff that doubles up to
+        INDEXER_MAX_BACKOFF_SECONDS; the cursor only moves once a page is
+        written.
+        """
+        backoff = poll_interval
+        while True:
+            try:
+                count = await self.index_page()
+            except Exception as e:
+                print(f"❌ Indexer error: {e}")
+                metrics.inc("indexer_errors_total")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, INDEXER_MAX_BACKOFF_SECONDS)
+                continue
+            backoff = poll_interval
+            if count < self.page_size:
+                await asyncio.sleep(poll_interval)
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Event Indexer")
+    print("=" * 40)
+
+    client = node_client()
+    await metrics.start()
+    store = PotStore()
+    print(f"✅ Store: {INDEXER_DB} (resuming at event {store.get_cursor()})")
+    try:
+        await PotEventIndexer(client, store).run()
+    finally:
+        store.close()
+        await client.close()
+        await metrics.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,221 @@
+"""
+Money Pot Upstream Limits
+Adaptive (AIMD) concurrency limits with optional token buckets, shared per
+upstream and endpoint class so concurrent hunts queue instead of stampeding
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from metrics import metrics
+
+# Endpoint class -> (initial, maximum) concurrent calls per upstream
+UPSTREAM_LIMITS: Dict[str, tuple[int, int]] = {
+    "authenticate": (8, 128),
+    "register": (4, 64),
+    "view": (16, 256),
+    "submit": (8, 128),
+}
+
+# Statuses an upstream sends when it is overloaded
+OVERLOAD_STATUSES = (429, 503)
+
+UPSTREAM_LIMITS_ENABLED = os.getenv("UPSTREAM_LIMITS", "1") != "0"
+
+
+def _rate_from_env(endpoint_class: str) -> Optional[float]:
+    # e.g. UPSTREAM_RPS_SUBMIT=20 caps submits at 20 per second per upstream
+    rate = os.getenv(f"UPSTREAM_RPS_{endpoint_class.upper()}")
+    return float(rate) if rate else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header; HTTP dates are ignored"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one class of calls to one upstream
+
+    Callers beyond the limit wait in FIFO order. Every successful call
+    raises the limit by 1/limit, about one per limit's worth of calls; an
+    overload answer (429/503) multiplies it by ``decrease``, at most once
+    per round of calls started before the previous decrease, and pauses new
+    calls for any Retry-After. With a ``rate``, a token bucket also caps
+    calls per second.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 256,
+        decrease: float = 0.5,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.labels = labels or {"limiter": name}
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._decreased_at = 0.0
+        self._paused_until = 0.0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        metrics.gauge("upstream_limit", self.limit, **self.labels)
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def slot(self) -> "_Slot":
+        """Async context manager holding one slot for the duration of a call"""
+        return _Slot(self)
+
+    async def acquire(self) -> float:
+        """Wait for a slot (and token); returns the call's start time for release"""
+        self._wake()  # Drops waiters cancelled at the head of the queue
+        if self._waiters or self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            metrics.gauge("upstream_queued", 1, **self.labels)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted a slot just as we were cancelled: pass it on
+                    self.in_flight -= 1
+                    self._wake()
+                raise
+            finally:
+                metrics.gauge("upstream_queued", -1, **self.labels)
+        else:
+            self.in_flight += 1
+
+        try:
+            delay = max(self._paused_until - time.monotonic(), self._reserve_token())
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self.in_flight -= 1
+            self._wake()
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, overloaded: bool = False, succeeded: bool = True, retry_after: Optional[float] = None):
+        """Give a slot back, adapting the limit to how the call went"""
+        self.in_flight -= 1
+        previous = self.limit
+        now = time.monotonic()
+        if overloaded:
+            metrics.inc("upstream_overloads_total", **self.labels)
+            # Calls that started before the last decrease saw the old limit
+            if started >= self._decreased_at:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self._decreased_at = now
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+        elif succeeded:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        if self.limit != previous:
+            metrics.gauge("upstream_limit", self.limit - previous, **self.labels)
+        self._wake()
+
+    def _reserve_token(self) -> float:
+        """Take a token, returning how long to wait until it is really available"""
+        if self.rate is None:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _wake(self):
+        while self._waiters and (self._waiters[0].done() or self.in_flight < self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue  # Cancelled while queued
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+class _Slot:
+    __slots__ = ("limiter", "started", "overload", "retry_after")
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+        self.overload = False
+        self.retry_after: Optional[float] = None
+
+    def overloaded(self, retry_after: Optional[float] = None):
+        """Mark the call as shed by the upstream"""
+        self.overload = True
+        self.retry_after = retry_after
+
+    async def __aenter__(self):
+        self.started = await self.limiter.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Other errors say nothing about load, so they leave the limit alone
+        self.limiter.release(
+            self.started, overloaded=self.overload, succeeded=exc_type is None, retry_after=self.retry_after
+        )
+        return False
+
+
+class _NullSlot:
+    __slots__ = ()
+
+    def overloaded(self, retry_after: Optional[float] = None):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SLOT = _NullSlot()
+
+_limiters: Dict[tuple[str, str], AdaptiveLimiter] = {}
+
+
+def upstream_limiter(upstream: str, endpoint_class: str) -> Optional[AdaptiveLimiter]:
+    """The process-wide limiter for an upstream's endpoint class, or None if unlimited"""
+    if not UPSTREAM_LIMITS_ENABLED or endpoint_class not in UPSTREAM_LIMITS:
+        return None
+    key = (upstream, endpoint_class)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        initial, maximum = UPSTREAM_LIMITS[endpoint_class]
+        limiter = _limiters[key] = AdaptiveLimiter(
+            f"{upstream} {endpoint_class}",
+            initial=initial,
+            maximum=maximum,
+            rate=_rate_from_env(endpoint_class),
+            labels={"upstream": upstream, "endpoint_class": endpoint_class},
+        )
+    return limiter
+
+
+def upstream_slot(upstream: str, endpoint_class: str):
+    """A slot from upstream_limiter, or a no-op slot for unlimited classes"""
+    limiter = upstream_limiter(upstream, endpoint_class)
+    return _NULL_SLOT if limiter is None else limiter.slot()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Money Pot Load Generator
+Runs hunt_pot_flow concurrently across many funded hunter accounts and pots
+"""
+
+import asyncio
+import copy
+import math
+import os
+import random
+import secrets
+import time
+from typing import Dict
+
+from app import MoneyPotApp
+from provision import Keystore, Provisioner
+
+# Load configuration
+HUNTERS = int(os.getenv("LOADGEN_HUNTERS", "8"))
+POTS = int(os.getenv("LOADGEN_POTS", "4"))
+POT_IDS = [int(x) for x in os.getenv("LOADGEN_POT_IDS", "").split(",") if x]
+HUNTS = int(os.getenv("LOADGEN_HUNTS", "64"))
+CONCURRENCY = int(os.getenv("LOADGEN_CONCURRENCY", "8"))
+ARRIVAL_RATE = float(os.getenv("LOADGEN_RATE", "0"))  # Hunts per second, 0 = unthrottled
+APT_FUND_AMOUNT = int(os.getenv("LOADGEN_APT_FUND", "10000000"))
+TOKEN_FUND_AMOUNT = int(os.getenv("LOADGEN_TOKEN_FUND", "10000"))
+POT_DURATION_SECONDS = int(os.getenv("LOADGEN_POT_DURATION", "3600"))
+# Reuse hunters across runs from this keystore; by default they live in memory
+KEYSTORE = os.getenv("LOADGEN_KEYSTORE", ":memory:")
+
+PHASES = ("attempt", "authenticate_options", "solve", "authenticate_verify", "total")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[rank]
+
+
+def format_latency_table(samples: Dict[str, list[float]]) -> str:
+    """Render count and p50/p95/p99 latency (ms) per phase"""
+    lines = [f"   {'phase':<22} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for phase, values in samples.items():
+        lines.append(
+            f"   {phase:<22} {len(values):>6} "
+            f"{percentile(values, 50) * 1000:>9.1f} "
+            f"{percentile(values, 95) * 1000:>9.1f} "
+            f"{percentile(values, 99) * 1000:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+class LoadGenerator:
+    """Drives concurrent hunts, one in flight per hunter account"""
+
+    def __init__(self, app: MoneyPotApp):
+        self.app = app
+        self.hunters: asyncio.Queue = asyncio.Queue()
+        self.samples: Dict[str, list[float]] = {phase: [] for phase in PHASES}
+        self.errors = 0
+
+    async def provision_hunters(self, count: int):
+        """Create and fund `count` hunter accounts, pipelined from the creator account"""
+        print(f"\n👥 Provisioning {count} hunters...")
+        passphrase = os.getenv("KEYSTORE_PASSPHRASE") or secrets.token_hex(16)
+        keystore = Keystore(KEYSTORE, passphrase)
+        try:
+            provisioner = Provisioner(
+                self.app.client, [self.app.creator_account], keystore, APT_FUND_AMOUNT, TOKEN_FUND_AMOUNT
+            )
+            hunters = await provisioner.provision(count)
+        finally:
+            keystore.close()
+
+        for i, hunter in enumerate(hunters):
+            # Hunters share the node client and the verifier's connection pool
+            hunter_app = copy.copy(self.app)
+            hunter_app.hunter_account = hunter
+            self.hunters.put_nowait(hunter_app)
+            print(f"   ✅ Hunter {i + 1}/{count}: {hunter.account_address}")
+
+    async def hunt(self, pot_id: int):
+        hunter_app = await self.hunters.get()
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        try:
+            await hunter_app.hunt_pot_flow(str(pot_id), timings)
+        except Exception as e:
+            self.errors += 1
+            print(f"❌ Hunt on pot {pot_id} failed: {e}")
+        else:
+            timings["total"] = time.perf_counter() - started
+        finally:
+            self.hunters.put_nowait(hunter_app)
+        for phase, seconds in timings.items():
+            self.samples[phase].append(seconds)
+
+    async def run(self, pot_ids: list[int], hunts: int, concurrency: int, rate: float) -> float:
+        """Launch `hunts` hunts with Poisson arrivals and return the wall time"""
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = []
+
+        async def bounded_hunt(pot_id: int):
+            try:
+                await self.hunt(pot_id)
+            finally:
+                semaphore.release()
+
+        started = time.perf_counter()
+        for i in range(hunts):
+            if rate > 0:
+                await asyncio.sleep(random.expovariate(rate))
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(bounded_hunt(pot_ids[i % len(pot_ids)])))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float):
+        completed = len(self.samples["total"])
+        print("\n📊 Load test results")
+        print(f"   Hunts: {completed} ok, {self.errors} failed in {elapsed:.1f}s")
+        print(f"   Throughput: {completed / elapsed if elapsed else 0:.2f} hunts/s")
+        print(format_latency_table(self.samples))
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Load Generator")
+    print("=" * 40)
+
+    app = MoneyPotApp()
+    try:
+        await app.initialize()
+
+        pot_ids = list(POT_IDS)
+        for _ in range(POTS if not pot_ids else 0):
+            pot_ids.append(await app.create_pot_flow(duration_seconds=POT_DURATION_SECONDS))
+        print(f"✅ Pots: {pot_ids}")
+
+        generator = LoadGenerator(app)
+        await generator.provision_hunters(HUNTERS)
+        elapsed = await generator.run(pot_ids, HUNTS, min(CONCURRENCY, HUNTERS), ARRIVAL_RATE)
+        generator.report(elapsed)
+
+    finally:
+        await app.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,230 @@
+"""
+Money Pot Client Metrics
+Latency histograms, in-flight gauges and counters with pluggable sinks
+"""
+
+import json
+import os
+import time
+from typing import Dict, Any
+
+PREFIX = "moneypot"
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+def _key(name: str, labels: Dict[str, Any]) -> tuple:
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+def _format_labels(labels: tuple, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class PrometheusSink:
+    """Aggregates metrics in memory and renders the Prometheus text format"""
+
+    def __init__(self):
+        self.histograms: Dict[tuple, list] = {}  # key -> [bucket counts, sum, count]
+        self.counters: Dict[tuple, float] = {}
+        self.gauges: Dict[tuple, float] = {}
+        self.runner = None
+
+    def observe(self, name: str, value: float, labels: Dict[str, Any]):
+        key = _key(name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                histogram[0][i] += 1
+                break
+        histogram[1] += value
+        histogram[2] += 1
+
+    def inc(self, name: str, value: float, labels: Dict[str, Any]):
+        key = _key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def gauge(self, name: str, delta: float, labels: Dict[str, Any]):
+        key = _key(name, labels)
+        self.gauges[key] = self.gauges.get(key, 0) + delta
+
+    def drain(self) -> tuple:
+        """Hand over everything aggregated so far and start again from zero"""
+        state = (self.histograms, self.counters, self.gauges)
+        self.histograms, self.counters, self.gauges = {}, {}, {}
+        return state
+
+    def merge(self, state: tuple):
+        """Add another sink's drained state, e.g. from a worker process"""
+        histograms, counters, gauges = state
+        for key, (buckets, total, count) in histograms.items():
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+            histogram[0] = [a + b for a, b in zip(histogram[0], buckets)]
+            histogram[1] += total
+            histogram[2] += count
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, value in gauges.items():
+            self.gauges[key] = self.gauges.get(key, 0) + value
+
+    def render(self) -> str:
+        lines = []
+        family = None
+        for (name, labels), (buckets, total, count) in sorted(self.histograms.items()):
+            if name != family:
+                family = name
+                lines.append(f"# TYPE {PREFIX}_{name} histogram")
+            cumulative = 0
+            for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                cumulative += bucket
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _format_labels(labels, f'le="{le}"')
+                lines.append(f"{PREFIX}_{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{PREFIX}_{name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{PREFIX}_{name}_count{_format_labels(labels)} {count}")
+        for kind, series in (("counter", self.counters), ("gauge", self.gauges)):
+            family = None
+            for (name, labels), value in sorted(series.items()):
+                if name != family:
+                    family = name
+                    lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+                lines.append(f"{PREFIX}_{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    async def serve(self, host: str, port: int):
+        """Expose /metrics over HTTP"""
+        from aiohttp import web
+
+        async def handle(request):
+            return web.Response(text=self.render(), content_type="text/plain", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+
+    async def close(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+class JsonlSink:
+    """Appends every observation to a JSON lines file for offline analysis"""
+
+    def __init__(self, path: str):
+        self.file = open(path, "a", buffering=1 << 16)
+
+    def _write(self, kind: str, name: str, value: float, labels: Dict[str, Any]):
+        self.file.write(json.dumps({"ts": time.time(), "kind": kind, "name": name, "value": value, "labels": labels}))
+        self.file.write("\n")
+
+    def observe(self, name: str, value: float, labels: Dict[str, Any]):
+        self._write("observe", name, value, labels)
+
+    def inc(self, name: str, value: float, labels: Dict[str, Any]):
+        self._write("inc", name, value, labels)
+
+    def gauge(self, name: str, delta: float, labels: Dict[str, Any]):
+        self._write("gauge", name, delta, labels)
+
+    async def close(self):
+        self.file.close()
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "labels", "started")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, Any]):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.metrics.gauge(f"{self.name}_in_flight", 1, **self.labels)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.observe(f"{self.name}_seconds", time.perf_counter() - self.started, **self.labels)
+        self.metrics.gauge(f"{self.name}_in_flight", -1, **self.labels)
+        if exc_type is not None:
+            self.metrics.inc(f"{self.name}_errors_total", **self.labels)
+        return False
+
+
+class Metrics:
+    """Fan-out to the configured sinks; a no-op when none are configured"""
+
+    def __init__(self):
+        self.sinks: list = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def track(self, name: str, **labels):
+        """Context manager timing a call: latency histogram, in-flight gauge and error count"""
+        if not self.sinks:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def observe(self, name: str, value: float, **labels):
+        for sink in self.sinks:
+            sink.observe(name, value, labels)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        for sink in self.sinks:
+            sink.inc(name, value, labels)
+
+    def gauge(self, name: str, delta: float, **labels):
+        for sink in self.sinks:
+            sink.gauge(name, delta, labels)
+
+    def configure_from_env(self):
+        """Add sinks named by METRICS_PROMETHEUS_PORT and METRICS_JSONL"""
+        if os.getenv("METRICS_PROMETHEUS_PORT") and not any(isinstance(s, PrometheusSink) for s in self.sinks):
+            self.add_sink(PrometheusSink())
+        if os.getenv("METRICS_JSONL") and not any(isinstance(s, JsonlSink) for s in self.sinks):
+            self.add_sink(JsonlSink(os.getenv("METRICS_JSONL")))
+
+    async def start(self):
+        """Configure from the environment and start the Prometheus endpoint if requested"""
+        self.configure_from_env()
+        port = os.getenv("METRICS_PROMETHEUS_PORT")
+        for sink in self.sinks:
+            if isinstance(sink, PrometheusSink) and port and sink.runner is None:
+                await sink.serve(os.getenv("METRICS_PROMETHEUS_HOST", "127.0.0.1"), int(port))
+
+    async def close(self):
+        for sink in self.sinks:
+            await sink.close()
+        self.sinks = []
+
+
+metrics = Metrics()
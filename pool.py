@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Money Pot Worker Pool
+Spreads hunting and settlement over worker processes, one event loop per core
+
+A coordinator hands pot IDs to hunt workers through a shared queue, so idle
+workers pick up the next hunt, and routes settlement outcomes to a single
+settle worker (settling is signed by the one oracle account). Each hunt
+worker owns its own slice of keystore hunters, node client, verifier
+connection pool and upstream limits; workers ship results and their metrics
+back to the coordinator, which serves the merged metrics per worker.
+"""
+
+import abc
+import asyncio
+import contextlib
+import copy
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from typing import Dict
+
+from app import (
+    NODE_URL,
+    MoneyPotApp,
+    NodeViewClient,
+    get_active_pots,
+    load_oracle_account_from_env,
+    node_client,
+)
+from loadgen import PHASES, format_latency_table
+from metrics import PrometheusSink, metrics
+from provision import KEYSTORE_PATH, Keystore
+from settle import SettlementDaemon, SettlementJournal, parse_outcome
+
+POOL_WORKERS = int(os.getenv("POOL_WORKERS", "0")) or os.cpu_count() or 1
+POOL_HUNTERS_PER_WORKER = int(os.getenv("POOL_HUNTERS_PER_WORKER", "8"))
+POOL_HUNTS = int(os.getenv("POOL_HUNTS", "256"))
+POOL_POT_IDS = [int(x) for x in os.getenv("POOL_POT_IDS", "").split(",") if x]
+# JSON lines of verifier outcomes to settle, as read by settle.py; "-" for stdin
+POOL_OUTCOMES = os.getenv("POOL_OUTCOMES", "")
+POOL_METRICS_INTERVAL = float(os.getenv("POOL_METRICS_INTERVAL", "5"))
+# Where to write the merged metrics in the Prometheus text format at exit
+POOL_METRICS_FILE = os.getenv("POOL_METRICS_FILE", "")
+
+# Worker roles, which are also the work item and result kinds
+HUNT, SETTLE = "hunt", "settle"
+# Other messages from workers to the coordinator
+METRICS, DONE = "metrics", "done"
+
+
+class PoolWorker(abc.ABC):
+    """One worker process's event loop: pulls work items and reports results"""
+
+    def __init__(self, index: int, tasks: multiprocessing.Queue, results: multiprocessing.Queue, sink: PrometheusSink):
+        self.index = index
+        self.tasks = tasks
+        self.results = results
+        self.sink = sink
+
+    async def run(self) -> dict:
+        flusher = asyncio.create_task(self._flush_metrics())
+        try:
+            return await self.work()
+        finally:
+            flusher.cancel()
+
+    @abc.abstractmethod
+    async def work(self) -> dict:
+        """Process work items until the stop sentinel, returning a summary for the coordinator"""
+
+    async def items(self):
+        """Work items from the coordinator until its stop sentinel"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self.tasks.get)
+            if item is None:
+                return
+            yield item
+
+    async def _flush_metrics(self):
+        while True:
+            await asyncio.sleep(POOL_METRICS_INTERVAL)
+            self.results.put((METRICS, self.index, self.sink.drain()))
+
+
+class HuntWorker(PoolWorker):
+    """Hunts pots with its own slice of the keystore's hunters, one hunt in flight per hunter"""
+
+    def __init__(self, index: int, tasks, results, sink: PrometheusSink, hunter_offset: int, hunter_count: int):
+        super().__init__(index, tasks, results, sink)
+        self.hunter_offset = hunter_offset
+        self.hunter_count = hunter_count
+
+    async def work(self) -> dict:
+        keystore = Keystore(KEYSTORE_PATH, os.environ["KEYSTORE_PASSPHRASE"])
+        try:
+            hunters = keystore.hunters(self.hunter_count, self.hunter_offset)
+        finally:
+            keystore.close()
+
+        app = MoneyPotApp()
+        # Hunt workers never create pots, so they need no creator key
+        app.creator_account = app.hunter_account = hunters[0]
+        try:
+            await app.initialize()
+            # Holds at most one waiting item per hunter, leaving the rest to other workers
+            work: asyncio.Queue = asyncio.Queue(maxsize=len(hunters))
+            hunting = []
+            for hunter in hunters:
+                hunter_app = copy.copy(app)
+                hunter_app.hunter_account = hunter
+                hunting.append(asyncio.create_task(self._hunter(hunter_app, work)))
+            async for item in self.items():
+                await work.put(item)
+            for _ in hunting:
+                await work.put(None)
+            await asyncio.gather(*hunting)
+        finally:
+            await app.close()
+        return {"hunters": len(hunters)}
+
+    async def _hunter(self, hunter_app: MoneyPotApp, work: asyncio.Queue):
+        while True:
+            item = await work.get()
+            if item is None:
+                return
+            _, pot_id = item
+            timings: Dict[str, float] = {}
+            started = time.perf_counter()
+            try:
+                attempt_id = await hunter_app.hunt_pot_flow(str(pot_id), timings)
+            except Exception as e:
+                self.results.put((HUNT, self.index, pot_id, None, timings, str(e)))
+                continue
+            timings["total"] = time.perf_counter() - started
+            self.results.put((HUNT, self.index, pot_id, attempt_id, timings, None))
+
+
+class SettleWorker(PoolWorker):
+    """Settles outcomes through a SettlementDaemon and its journal"""
+
+    async def work(self) -> dict:
+        client = node_client()
+        await metrics.start()
+        journal = SettlementJournal()
+        daemon = SettlementDaemon(client, load_oracle_account_from_env(), journal)
+        try:
+            await daemon.recover()
+            runner = asyncio.create_task(daemon.run())
+            async for _, attempt_id, status in self.items():
+                daemon.enqueue(attempt_id, status)
+            await daemon.wait_idle()
+            runner.cancel()
+            return journal.counts()
+        finally:
+            journal.close()
+            await client.close()
+            await metrics.close()
+
+
+def worker_main(index: int, role: str, tasks, results, hunter_offset: int = 0, hunter_count: int = 0):
+    """Worker process entry point"""
+    # Only the coordinator serves /metrics; workers ship their aggregates to it
+    os.environ.pop("METRICS_PROMETHEUS_PORT", None)
+    if os.getenv("METRICS_JSONL"):
+        os.environ["METRICS_JSONL"] = f"{os.environ['METRICS_JSONL']}.{index}"
+    sink = PrometheusSink()
+    metrics.add_sink(sink)
+
+    if role == HUNT:
+        worker = HuntWorker(index, tasks, results, sink, hunter_offset, hunter_count)
+    else:
+        worker = SettleWorker(index, tasks, results, sink)
+    try:
+        # Per-hunt progress output from thousands of hunts is noise; results go to the coordinator
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            summary = asyncio.run(worker.run())
+    except Exception as e:
+        summary = {"error": f"{type(e).__name__}: {e}"}
+    results.put((METRICS, index, sink.drain()))
+    results.put((DONE, index, summary))
+
+
+def _with_worker_label(state: tuple, index: int) -> tuple:
+    """A drained sink state with every series labelled by the worker it came from"""
+    label = ("worker", str(index))
+    return tuple(
+        {(name, tuple(sorted(labels + (label,)))): value for (name, labels), value in series.items()}
+        for series in state
+    )
+
+
+def load_outcomes(path: str) -> list[tuple[int, bool]]:
+    """(attempt_id, status) from JSON lines, as read by settle.py"""
+    outcomes = []
+    with (contextlib.nullcontext(sys.stdin) if path == "-" else open(path)) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                outcomes.append(parse_outcome(line))
+            except ValueError as e:
+                print(f"❌ Bad outcome {line.strip()!r}: {e}")
+    return outcomes
+
+
+class Coordinator:
+    """Starts the workers, hands out work items and gathers their results and metrics"""
+
+    def __init__(self, hunt_workers: int, hunters_per_worker: int, settle: bool):
+        # Spawned, not forked: workers start clean of the coordinator's threads and event loop
+        self.context = multiprocessing.get_context("spawn")
+        self.hunt_tasks = self.context.Queue()
+        self.settle_tasks = self.context.Queue()
+        self.results = self.context.Queue()
+        self.hunt_workers = hunt_workers
+        self.hunters_per_worker = hunters_per_worker
+        self.settle = settle
+        self.processes: list[multiprocessing.Process] = []
+        self.roles: list[str] = []
+        self.sink = PrometheusSink()
+        self.samples: Dict[str, list[float]] = {phase: [] for phase in PHASES}
+        self.hunts: Dict[int, list[int]] = {}  # worker -> [ok, failed]
+        self.summaries: Dict[int, dict] = {}
+
+    def start(self):
+        for i in range(self.hunt_workers):
+            self._spawn(HUNT, self.hunt_tasks, i * self.hunters_per_worker, self.hunters_per_worker)
+        if self.settle:
+            self._spawn(SETTLE, self.settle_tasks)
+
+    def _spawn(self, role: str, tasks, *args):
+        index = len(self.processes)
+        process = self.context.Process(
+            target=worker_main, args=(index, role, tasks, self.results, *args), name=f"pool-{role}-{index}", daemon=True
+        )
+        process.start()
+        self.processes.append(process)
+        self.roles.append(role)
+        self.hunts[index] = [0, 0]
+
+    def dispatch(self, pot_ids: list[int], hunts: int, outcomes: list[tuple[int, bool]]):
+        """Queue every work item, followed by one stop sentinel per worker"""
+        for i in range(hunts):
+            self.hunt_tasks.put((HUNT, pot_ids[i % len(pot_ids)]))
+        for _ in range(self.hunt_workers):
+            self.hunt_tasks.put(None)
+        if self.settle:
+            for attempt_id, status in outcomes:
+                self.settle_tasks.put((SETTLE, attempt_id, status))
+            self.settle_tasks.put(None)
+
+    async def gather(self):
+        """Collect results until every worker is done or has died"""
+        loop = asyncio.get_running_loop()
+        running = set(range(len(self.processes)))
+        while running:
+            try:
+                message = await loop.run_in_executor(None, self.results.get, True, 1.0)
+            except queue.Empty:
+                for index in list(running):
+                    # A clean exit always sends DONE first, so only a crash needs this
+                    exitcode = self.processes[index].exitcode
+                    if exitcode not in (None, 0):
+                        print(f"❌ Worker {index} exited with code {exitcode}")
+                        self.summaries[index] = {"error": f"exit code {exitcode}"}
+                        running.discard(index)
+                continue
+
+            kind, index = message[0], message[1]
+            if kind == METRICS:
+                self.sink.merge(_with_worker_label(message[2], index))
+            elif kind == HUNT:
+                _, _, pot_id, attempt_id, timings, error = message
+                if error is not None:
+                    self.hunts[index][1] += 1
+                    print(f"❌ Worker {index}: hunt on pot {pot_id} failed: {error}")
+                    continue
+                self.hunts[index][0] += 1
+                for phase, seconds in timings.items():
+                    self.samples[phase].append(seconds)
+            elif kind == DONE:
+                self.summaries[index] = message[2]
+                running.discard(index)
+                if "error" in message[2]:
+                    print(f"❌ Worker {index} failed: {message[2]['error']}")
+
+        for process in self.processes:
+            process.join()
+
+    def report(self, elapsed: float):
+        completed = len(self.samples["total"])
+        failed = sum(failed for _, failed in self.hunts.values())
+        print("\n📊 Pool results")
+        print(f"   {'worker':<8} {'role':<8} {'ok':>6} {'failed':>7}  summary")
+        for index, role in enumerate(self.roles):
+            # Hunt counts only; a settle worker's outcomes are in its journal summary
+            ok, errors = self.hunts[index] if role == HUNT else ("-", "-")
+            print(f"   {index:<8} {role:<8} {ok:>6} {errors:>7}  {self.summaries.get(index, {})}")
+        print(f"   Hunts: {completed} ok, {failed} failed in {elapsed:.1f}s")
+        print(f"   Throughput: {completed / elapsed if elapsed else 0:.2f} hunts/s")
+        print(format_latency_table(self.samples))
+        if POOL_METRICS_FILE:
+            with open(POOL_METRICS_FILE, "w") as f:
+                f.write(self.sink.render())
+            print(f"✅ Metrics: {POOL_METRICS_FILE}")
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Worker Pool")
+    print("=" * 40)
+
+    outcomes = load_outcomes(POOL_OUTCOMES) if POOL_OUTCOMES else []
+    settle = bool(outcomes)
+    # The settle worker is mostly waiting on the node, but still takes a core
+    hunt_workers = max(1, POOL_WORKERS - settle) if POOL_HUNTS else 0
+
+    pot_ids = list(POOL_POT_IDS)
+    if hunt_workers:
+        passphrase = os.getenv("KEYSTORE_PASSPHRASE")
+        if not passphrase:
+            raise RuntimeError("KEYSTORE_PASSPHRASE is not set")
+        keystore = Keystore(KEYSTORE_PATH, passphrase)
+        try:
+            available = keystore.count()
+        finally:
+            keystore.close()
+        needed = hunt_workers * POOL_HUNTERS_PER_WORKER
+        if available < needed:
+            raise RuntimeError(
+                f"{KEYSTORE_PATH} holds {available} hunters, {needed} needed; "
+                f"run provision.py with PROVISION_HUNTERS={needed}"
+            )
+        if not pot_ids:
+            client = NodeViewClient(NODE_URL)
+            try:
+                pot_ids = await get_active_pots(client)
+            finally:
+                await client.close()
+        if not pot_ids:
+            raise RuntimeError("No active pots to hunt")
+        print(f"✅ Pots: {pot_ids}")
+
+    print(f"✅ {hunt_workers} hunt workers x {POOL_HUNTERS_PER_WORKER} hunters, {POOL_HUNTS} hunts")
+    if settle:
+        print(f"✅ 1 settle worker, {len(outcomes)} outcomes")
+
+    coordinator = Coordinator(hunt_workers, POOL_HUNTERS_PER_WORKER, settle)
+    metrics.add_sink(coordinator.sink)
+    await metrics.start()
+    try:
+        started = time.perf_counter()
+        coordinator.start()
+        coordinator.dispatch(pot_ids, POOL_HUNTS if hunt_workers else 0, outcomes)
+        await coordinator.gather()
+        coordinator.report(time.perf_counter() - started)
+    finally:
+        await metrics.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Money Pot Hunter Provisioning
+Generates hunter accounts into an encrypted keystore, then creates and funds
+them through pipelined submitters, resuming wherever a previous run stopped
+"""
+
+import asyncio
+import base64
+import os
+import secrets
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from app import (
+    MODULE_QN,
+    Account,
+    AsyncRestClient,
+    TransactionSubmitter,
+    create_account_payload,
+    fund_account_payload,
+    fund_fungible_asset_payload,
+    load_main_account_from_env,
+    node_client,
+    view_function,
+)
+from metrics import metrics
+
+KEYSTORE_PATH = os.getenv("KEYSTORE_PATH", "hunters_keystore.db")
+KEYSTORE_KDF_ITERATIONS = int(os.getenv("KEYSTORE_KDF_ITERATIONS", "480000"))
+PROVISION_HUNTERS = int(os.getenv("PROVISION_HUNTERS", "100"))
+PROVISION_APT_FUND = int(os.getenv("PROVISION_APT_FUND", "10000000"))
+PROVISION_TOKEN_FUND = int(os.getenv("PROVISION_TOKEN_FUND", "10000"))
+PROVISION_MAX_IN_FLIGHT = int(os.getenv("PROVISION_MAX_IN_FLIGHT", "32"))  # Per funder
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hunters (
+    idx INTEGER PRIMARY KEY,
+    address TEXT NOT NULL UNIQUE,
+    private_key BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    address TEXT NOT NULL,
+    step TEXT NOT NULL,
+    state TEXT NOT NULL,
+    tx_hash TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (address, step)
+);
+"""
+
+# Provisioning steps per hunter, submitted in this order from the same funder
+CREATE, FUND_APT, FUND_TOKEN = "create", "fund_apt", "fund_token"
+
+# Step states: submitted -> confirmed | failed; failed steps are redone on the next run
+SUBMITTED, CONFIRMED, FAILED = "submitted", "confirmed", "failed"
+
+KEYSTORE_CHECK = b"money-pot-keystore"
+
+
+class Keystore:
+    """SQLite store of hunter private keys, encrypted with a passphrase
+
+    Keys are sealed with Fernet under a PBKDF2-SHA256 key derived from the
+    passphrase and a per-keystore salt. The same file journals each
+    hunter's provisioning steps.
+    """
+
+    def __init__(self, path: str, passphrase: str, iterations: int = KEYSTORE_KDF_ITERATIONS):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self.fernet = self._unlock(passphrase, iterations)
+
+    def _unlock(self, passphrase: str, iterations: int):
+        from cryptography.fernet import Fernet, InvalidToken
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        meta = dict(self.db.execute("SELECT key, value FROM meta").fetchall())
+        salt = meta.get("salt") or secrets.token_bytes(16)
+        iterations = int(meta.get("iterations", iterations))
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=iterations)
+        fernet = Fernet(base64.urlsafe_b64encode(kdf.derive(passphrase.encode())))
+
+        if "check" not in meta:
+            with self.db:
+                self.db.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                    ("salt", salt),
+                    ("iterations", str(iterations)),
+                    ("check", fernet.encrypt(KEYSTORE_CHECK)),
+                ])
+        else:
+            try:
+                fernet.decrypt(meta["check"])
+            except InvalidToken:
+                raise RuntimeError("Wrong keystore passphrase") from None
+        return fernet
+
+    def close(self):
+        self.db.close()
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM hunters").fetchone()[0]
+
+    def generate(self, count: int) -> int:
+        """Add fresh hunter keys until the keystore holds `count`; returns how many were added"""
+        missing = max(0, count - self.count())
+        accounts = [Account.generate() for _ in range(missing)]
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO hunters (address, private_key) VALUES (?, ?)",
+                [(str(a.account_address), self.fernet.encrypt(a.private_key.hex().encode())) for a in accounts],
+            )
+        return missing
+
+    def hunters(self, limit: int, offset: int = 0) -> list[Account]:
+        """`limit` hunters in keystore order after the first `offset`, decrypted"""
+        rows = self.db.execute(
+            "SELECT private_key FROM hunters ORDER BY idx LIMIT ? OFFSET ?", (limit, offset)
+        ).fetchall()
+        return [Account.load_key(self.fernet.decrypt(row[0]).decode()) for row in rows]
+
+    def steps(self, addresses: list[str]) -> Dict[tuple[str, str], tuple[str, Optional[str]]]:
+        """(address, step) -> (state, tx_hash) for every journaled step of these hunters"""
+        journaled = {}
+        for address, step, state, tx_hash in self.db.execute("SELECT address, step, state, tx_hash FROM steps"):
+            journaled[(address, step)] = (state, tx_hash)
+        wanted = set(addresses)
+        return {key: value for key, value in journaled.items() if key[0] in wanted}
+
+    def mark(self, address: str, step: str, state: str, tx_hash: Optional[str] = None):
+        with self.db:
+            self.db.execute(
+                "INSERT INTO steps (address, step, state, tx_hash, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (address, step) DO UPDATE SET state = excluded.state, "
+                "tx_hash = COALESCE(excluded.tx_hash, tx_hash), updated_at = excluded.updated_at",
+                (address, step, state, tx_hash, time.time()),
+            )
+
+    def counts(self) -> dict:
+        return dict(self.db.execute("SELECT state, COUNT(*) FROM steps GROUP BY state").fetchall())
+
+
+class Provisioner:
+    """Creates and funds keystore hunters, pipelined across one or more funder accounts
+
+    Each hunter is assigned a funder by index, and all of its steps go
+    through that funder's TransactionSubmitter, so sequence-number order
+    keeps them in order without waiting between them.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRestClient,
+        funders: list[Account],
+        keystore: Keystore,
+        apt_amount: int = PROVISION_APT_FUND,
+        token_amount: int = PROVISION_TOKEN_FUND,
+        max_in_flight: int = PROVISION_MAX_IN_FLIGHT,
+    ):
+        self.client = client
+        self.keystore = keystore
+        self.apt_amount = apt_amount
+        self.token_amount = token_amount
+        self.submitters = [TransactionSubmitter(client, funder, max_in_flight) for funder in funders]
+        self.token: Optional[str] = None
+
+    @property
+    def step_names(self) -> tuple[str, ...]:
+        return (CREATE, FUND_APT, FUND_TOKEN) if self.token_amount else (CREATE, FUND_APT)
+
+    def payload(self, step: str, hunter: Account):
+        address = hunter.account_address
+        if step == CREATE:
+            return create_account_payload(address)
+        if step == FUND_APT:
+            return fund_account_payload(address, self.apt_amount)
+        return fund_fungible_asset_payload(address, self.token, self.token_amount)
+
+    async def _committed(self, tx_hash: str) -> bool:
+        """Whether a transaction journaled by an earlier run committed successfully"""
+        try:
+            tx = await self.client.transaction_by_hash(tx_hash)
+        except Exception:
+            # Not committed. If it is still in a mempool, redoing the step can
+            # fund the hunter twice, which is harmless for test accounts
+            return False
+        return tx.get("type") == "user_transaction" and bool(tx.get("success"))
+
+    async def _account_exists(self, hunter: Account) -> bool:
+        try:
+            await self.client.account(hunter.account_address)
+        except Exception:
+            return False
+        return True
+
+    async def pending_steps(self, hunters: list[Account]) -> list[tuple[int, Account, str]]:
+        """(hunter index, hunter, step) still to do, settling steps left submitted by a crash"""
+        journaled = self.keystore.steps([str(h.account_address) for h in hunters])
+        submitted = {
+            key: tx_hash for key, (state, tx_hash) in journaled.items() if state == SUBMITTED and tx_hash
+        }
+        semaphore = asyncio.Semaphore(32)
+
+        async def check(tx_hash: str) -> bool:
+            async with semaphore:
+                return await self._committed(tx_hash)
+
+        outcomes = await asyncio.gather(*(check(tx_hash) for tx_hash in submitted.values()))
+        for key, committed in zip(submitted, outcomes):
+            if committed:
+                self.keystore.mark(*key, CONFIRMED)
+                journaled[key] = (CONFIRMED, submitted[key])
+
+        pending = []
+        for i, hunter in enumerate(hunters):
+            for step in self.step_names:
+                state, _ = journaled.get((str(hunter.account_address), step), (None, None))
+                if state != CONFIRMED:
+                    pending.append((i, hunter, step))
+        return pending
+
+    async def provision(self, count: int) -> list[Account]:
+        """Make sure `count` hunters exist, are created and are funded; returns them"""
+        added = self.keystore.generate(count)
+        hunters = self.keystore.hunters(count)
+        print(f"   Keystore: {len(hunters)} hunters ({added} new)")
+        if self.token_amount and self.token is None:
+            self.token = (await view_function(self.client, f"{MODULE_QN}::get_token", []))[0]
+
+        pending = await self.pending_steps(hunters)
+        print(f"   {len(pending)} steps to submit across {len(self.submitters)} funder(s)")
+        tracking = []
+        for i, hunter, step in pending:
+            address = str(hunter.account_address)
+            try:
+                tx_hash, future = await self.submitters[i % len(self.submitters)].submit_with_hash(
+                    self.payload(step, hunter)
+                )
+            except Exception as e:
+                print(f"❌ Submitting {step} for {address} failed: {e}")
+                self.keystore.mark(address, step, FAILED)
+                continue
+            # Journal the hash so a restart can tell whether it committed
+            self.keystore.mark(address, step, SUBMITTED, tx_hash)
+            tracking.append(asyncio.create_task(self._track(hunter, step, future)))
+        await asyncio.gather(*tracking)
+
+        remaining = await self.pending_steps(hunters)
+        if remaining:
+            raise RuntimeError(
+                f"{len(remaining)} provisioning steps failed ({self.keystore.counts()}); run again to resume"
+            )
+        return hunters
+
+    async def _track(self, hunter: Account, step: str, future: asyncio.Future):
+        address = str(hunter.account_address)
+        try:
+            receipt = await future
+            if not receipt.success:
+                raise RuntimeError(f"Transaction {receipt.hash} aborted: {receipt.vm_status}")
+        except Exception as e:
+            # An account created by an earlier, unjournaled attempt makes create abort
+            if step == CREATE and await self._account_exists(hunter):
+                self.keystore.mark(address, step, CONFIRMED)
+                return
+            print(f"❌ {step} for {address} failed: {e}")
+            self.keystore.mark(address, step, FAILED)
+            return
+        self.keystore.mark(address, step, CONFIRMED, receipt.hash)
+        metrics.inc("hunters_provisioned_total", step=step)
+
+
+def load_funder_accounts_from_env() -> list[Account]:
+    """Funders from FUNDER_PRIVATE_KEYS (comma separated), else the APTOS_PRIVATE_KEY account"""
+    keys = [key.strip() for key in os.getenv("FUNDER_PRIVATE_KEYS", "").split(",") if key.strip()]
+    if not keys:
+        return [load_main_account_from_env()]
+    return [Account.load_key(key) for key in keys]
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Hunter Provisioning")
+    print("=" * 40)
+
+    passphrase = os.getenv("KEYSTORE_PASSPHRASE")
+    if not passphrase:
+        raise RuntimeError("KEYSTORE_PASSPHRASE is not set")
+
+    client = node_client()
+    await metrics.start()
+    keystore = Keystore(KEYSTORE_PATH, passphrase)
+    funders = load_funder_accounts_from_env()
+    for funder in funders:
+        print(f"✅ Funder account: {funder.account_address}")
+
+    try:
+        started = time.perf_counter()
+        hunters = await Provisioner(client, funders, keystore).provision(PROVISION_HUNTERS)
+        print(f"✅ {len(hunters)} hunters ready in {time.perf_counter() - started:.1f}s: {KEYSTORE_PATH}")
+    finally:
+        keystore.close()
+        await client.close()
+        await metrics.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Money Pot Session Replay
+Records hunts' verifier responses and chain receipts to a gzipped JSON
+session, then replays them through MoneyPotApp.hunt_pot_flow and the
+solver with no network
+
+    python replay.py record SESSION POT_ID [POT_ID ...]
+    python replay.py play SESSION [--repeat N]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gzip
+import io
+import json
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from app import (
+    MONEY_AUTH_URL,
+    Account,
+    MoneyPotApp,
+    VerifierServiceClient,
+    node_client,
+)
+from loadgen import PHASES, format_latency_table
+
+SESSION_FORMAT = 1
+
+# Calls recorded on each side; anything else passes straight through
+NODE_METHODS = (
+    "submit_and_wait_for_bcs_transaction",
+    "submit_bcs_transaction",
+    "wait_for_transaction",
+    "transaction_by_hash",
+    "account_sequence_number",
+    "account_resource",
+    "view",
+)
+VERIFIER_METHODS = (
+    "health_check",
+    "register_options",
+    "register_verify",
+    "authenticate_options",
+    "authenticate_verify",
+)
+
+# Calls whose arguments a replay must reproduce exactly: the solver's output
+CHECKED_METHODS = ("authenticate_verify",)
+
+
+def _jsonable(args: tuple) -> Optional[list]:
+    """Arguments as they look after a JSON round trip, or None if they don't serialize"""
+    try:
+        return json.loads(json.dumps(list(args)))
+    except (TypeError, ValueError):
+        return None  # e.g. a SignedTransaction
+
+
+def _replay_key(method: str, args: Optional[list]) -> str:
+    # Views are matched on function and arguments, since the view cache decides which reach the node
+    if method == "view" and args:
+        return f"view:{args[0]}:{json.dumps(args[2])}"
+    return method
+
+
+class SessionRecorder:
+    """Collects [source, method, args, result] for every recorded call, in order"""
+
+    def __init__(self):
+        self.calls: list[list] = []
+        self.chain_id: Optional[int] = None
+        self.pot_ids: list[int] = []
+
+    def record(self, source: str, method: str, args: tuple, result: Any):
+        self.calls.append([source, method, _jsonable(args), result])
+
+    def save(self, path: str):
+        session = {
+            "format": SESSION_FORMAT,
+            "chain_id": self.chain_id,
+            "pot_ids": self.pot_ids,
+            "calls": self.calls,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(session, f, separators=(",", ":"))
+
+
+def load_session(path: str) -> Dict[str, Any]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        session = json.load(f)
+    if session.get("format") != SESSION_FORMAT:
+        raise RuntimeError(f"Unsupported session format {session.get('format')} in {path}")
+    return session
+
+
+class RecordingClient:
+    """Wraps a node or verifier client, recording the results of `methods`"""
+
+    def __init__(self, client, recorder: SessionRecorder, source: str, methods: tuple[str, ...]):
+        self.client = client
+        self.recorder = recorder
+        self.source = source
+        self.methods = methods
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.client, name)
+        if name not in self.methods:
+            return attr
+
+        async def recorded(*args, **kwargs):
+            result = await attr(*args, **kwargs)
+            self.recorder.record(self.source, name, args, result)
+            return result
+        return recorded
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class ReplayClient:
+    """Answers calls for one source of a recorded session, with no network
+
+    Responses are served per method (per function and arguments for views)
+    in recorded order, wrapping around so a session can be replayed many
+    times. Arguments of CHECKED_METHODS that differ from the recording are
+    collected in ``mismatches``.
+    """
+
+    def __init__(self, session: Dict[str, Any], source: str):
+        self.responses: Dict[str, list[tuple[Optional[list], Any]]] = {}
+        self.positions: Dict[str, int] = {}
+        self.mismatches: list[tuple[str, Optional[list], Optional[list]]] = []
+        for call_source, method, args, result in session["calls"]:
+            if call_source == source:
+                self.responses.setdefault(_replay_key(method, args), []).append((args, result))
+
+    async def replay(self, method: str, args: tuple) -> Any:
+        args = _jsonable(args)
+        key = _replay_key(method, args)
+        recorded = self.responses.get(key)
+        if not recorded:
+            raise RuntimeError(f"Session has no recorded {key} response")
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        recorded_args, result = recorded[position % len(recorded)]
+        if method in CHECKED_METHODS and recorded_args != args:
+            self.mismatches.append((method, recorded_args, args))
+        return result
+
+    def __getattr__(self, name: str):
+        async def replayed(*args, **kwargs):
+            return await self.replay(name, args)
+        return replayed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def close(self):
+        pass
+
+
+class ReplayNode(ReplayClient):
+    """Replays a session's node responses; transactions are still really signed"""
+
+    def __init__(self, session: Dict[str, Any]):
+        super().__init__(session, "node")
+        from aptos_sdk.async_client import RestClient as AsyncRestClient
+        # Never connects: with the chain ID primed, signing needs no request
+        self.signer = AsyncRestClient("http://replay.invalid/v1")
+        self.signer._chain_id = session["chain_id"]
+        self.sequence_number = 0
+
+    async def create_bcs_signed_transaction(self, sender: Account, payload, sequence_number: Optional[int] = None):
+        if sequence_number is None:
+            sequence_number = self.sequence_number
+            self.sequence_number += 1
+        return await self.signer.create_bcs_signed_transaction(sender, payload, sequence_number=sequence_number)
+
+    async def close(self):
+        await self.signer.close()
+
+
+async def record(path: str, pot_ids: list[int]):
+    """Hunt each pot against the live services, saving everything they answered"""
+    recorder = SessionRecorder()
+    node = RecordingClient(node_client(), recorder, "node", NODE_METHODS)
+    verifier = RecordingClient(VerifierServiceClient(MONEY_AUTH_URL), recorder, "verifier", VERIFIER_METHODS)
+    app = MoneyPotApp()
+    try:
+        await app.initialize(node=node, verifier=verifier)
+        recorder.chain_id = await node.chain_id()
+        for pot_id in pot_ids:
+            await app.hunt_pot_flow(str(pot_id))
+            recorder.pot_ids.append(pot_id)
+    finally:
+        await app.close()
+    recorder.save(path)
+    print(f"✅ Recorded {len(recorder.calls)} calls over {len(recorder.pot_ids)} hunts: {path}")
+
+
+async def play(path: str, repeat: int) -> int:
+    """Replay every recorded hunt `repeat` times and report per-phase latency"""
+    session = load_session(path)
+    node = ReplayNode(session)
+    verifier = ReplayClient(session, "verifier")
+    app = MoneyPotApp()
+    # Replayed transactions are signed but never verified, so any accounts will do
+    app.creator_account = Account.generate()
+    app.hunter_account = Account.generate()
+
+    samples: Dict[str, list[float]] = {phase: [] for phase in PHASES}
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await app.initialize(node=node, verifier=verifier)
+            for _ in range(repeat):
+                for pot_id in session["pot_ids"]:
+                    timings: Dict[str, float] = {}
+                    hunt_started = time.perf_counter()
+                    await app.hunt_pot_flow(str(pot_id), timings)
+                    timings["total"] = time.perf_counter() - hunt_started
+                    for phase, seconds in timings.items():
+                        samples[phase].append(seconds)
+    finally:
+        await app.close()
+    elapsed = time.perf_counter() - started
+
+    hunts = len(samples["total"])
+    print(f"\n📊 Replayed {hunts} hunts in {elapsed:.2f}s ({hunts / elapsed if elapsed else 0:.0f} hunts/s)")
+    print(format_latency_table(samples))
+    for method, recorded, replayed in verifier.mismatches[:10]:
+        print(f"❌ {method}: recorded {recorded}, replayed {replayed}")
+    if verifier.mismatches:
+        print(f"❌ {len(verifier.mismatches)} replayed calls differ from the recording")
+        return 1
+    return 0
+
+
+async def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(prog="replay.py", description="Record and replay hunting sessions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="hunt pots live and save the session")
+    record_parser.add_argument("session")
+    record_parser.add_argument("pot_ids", type=int, nargs="+")
+    play_parser = commands.add_parser("play", help="replay a saved session offline")
+    play_parser.add_argument("session")
+    play_parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    print("Money Pot Session Replay")
+    print("=" * 40)
+    if args.command == "record":
+        await record(args.session, args.pot_ids)
+        return 0
+    return await play(args.session, args.repeat)
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Money Pot Settlement Daemon
+Queues verifier outcomes and settles them on-chain with attempt_completed
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import Optional
+
+from app import (
+    AsyncRestClient,
+    TransactionSubmitter,
+    Account,
+    attempt_completed_payload,
+    get_attempts_bulk,
+    load_oracle_account_from_env,
+    node_client,
+)
+from metrics import metrics
+
+SETTLEMENT_JOURNAL = os.getenv("SETTLEMENT_JOURNAL", "settlement_journal.db")
+SETTLEMENT_MAX_IN_FLIGHT = int(os.getenv("SETTLEMENT_MAX_IN_FLIGHT", "32"))
+SETTLEMENT_MAX_RETRIES = int(os.getenv("SETTLEMENT_MAX_RETRIES", "3"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settlements (
+    attempt_id INTEGER PRIMARY KEY,
+    status INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    tx_hash TEXT,
+    retries INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS settlements_state ON settlements (state);
+"""
+
+# Journal states: queued -> submitted -> confirmed | failed
+QUEUED, SUBMITTED, CONFIRMED, FAILED = "queued", "submitted", "confirmed", "failed"
+
+
+class SettlementJournal:
+    """Durable SQLite record of every outcome the daemon has accepted"""
+
+    def __init__(self, path: str = SETTLEMENT_JOURNAL):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def add(self, attempt_id: int, status: bool) -> bool:
+        """Record a new outcome; False if the attempt was already journaled"""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT OR IGNORE INTO settlements (attempt_id, status, state, updated_at) VALUES (?, ?, ?, ?)",
+                (attempt_id, int(status), QUEUED, time.time()),
+            )
+        return cursor.rowcount == 1
+
+    def mark(self, attempt_id: int, state: str, tx_hash: Optional[str] = None, retried: bool = False):
+        with self.db:
+            self.db.execute(
+                "UPDATE settlements SET state = ?, tx_hash = COALESCE(?, tx_hash), "
+                "retries = retries + ?, updated_at = ? WHERE attempt_id = ?",
+                (state, tx_hash, int(retried), time.time(), attempt_id),
+            )
+
+    def retries(self, attempt_id: int) -> int:
+        row = self.db.execute("SELECT retries FROM settlements WHERE attempt_id = ?", (attempt_id,)).fetchone()
+        return row[0] if row else 0
+
+    def pending(self) -> list[tuple[int, bool, str]]:
+        """Outcomes that were queued or submitted but never confirmed"""
+        rows = self.db.execute(
+            "SELECT attempt_id, status, state FROM settlements WHERE state IN (?, ?) ORDER BY attempt_id",
+            (QUEUED, SUBMITTED),
+        ).fetchall()
+        return [(attempt_id, bool(status), state) for attempt_id, status, state in rows]
+
+    def counts(self) -> dict:
+        return dict(self.db.execute("SELECT state, COUNT(*) FROM settlements GROUP BY state").fetchall())
+
+
+class SettlementDaemon:
+    """Settles attempts through a bounded in-flight window, at most once per attempt_id"""
+
+    def __init__(
+        self,
+        client: AsyncRestClient,
+        oracle: Account,
+        journal: SettlementJournal,
+        max_in_flight: int = SETTLEMENT_MAX_IN_FLIGHT,
+        max_retries: int = SETTLEMENT_MAX_RETRIES,
+    ):
+        self.client = client
+        self.journal = journal
+        self.max_retries = max_retries
+        self.submitter = TransactionSubmitter(client, oracle, max_in_flight)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._tracking: set[asyncio.Task] = set()
+
+    def enqueue(self, attempt_id: int, status: bool) -> bool:
+        """Accept a verifier outcome; duplicates of a journaled attempt are dropped"""
+        if not self.journal.add(attempt_id, status):
+            return False
+        self.queue.put_nowait((attempt_id, status))
+        return True
+
+    async def recover(self) -> int:
+        """Re-queue journaled outcomes left unconfirmed by a previous run"""
+        pending = self.journal.pending()
+        if not pending:
+            return 0
+
+        # A submitted settlement may have committed before the restart
+        submitted = [attempt_id for attempt_id, _, state in pending if state == SUBMITTED]
+        attempts = await get_attempts_bulk(self.client, submitted)
+        requeued = 0
+        for attempt_id, status, state in pending:
+            attempt = attempts.get(attempt_id)
+            if attempt is not None and attempt.is_completed:
+                self.journal.mark(attempt_id, CONFIRMED)
+                continue
+            self.queue.put_nowait((attempt_id, status))
+            requeued += 1
+        return requeued
+
+    async def run(self):
+        """Submit queued settlements forever; the submitter bounds how many are in flight"""
+        while True:
+            attempt_id, status = await self.queue.get()
+            try:
+                future = await self.submitter.submit(attempt_completed_payload(attempt_id, status))
+            except Exception as e:
+                print(f"❌ Submitting settlement for attempt {attempt_id} failed: {e}")
+                await self._retry(attempt_id, status)
+                self.queue.task_done()
+                continue
+            self.journal.mark(attempt_id, SUBMITTED)
+            task = asyncio.create_task(self._track(attempt_id, status, future))
+            self._tracking.add(task)
+            task.add_done_callback(self._tracking.discard)
+
+    async def wait_idle(self):
+        """Wait until nothing is queued, in flight or awaiting a retry"""
+        await self.queue.join()
+
+    async def _track(self, attempt_id: int, status: bool, future: asyncio.Future):
+        try:
+            receipt = await future
+            if not receipt.success:
+                raise RuntimeError(f"Transaction {receipt.hash} aborted: {receipt.vm_status}")
+        except Exception as e:
+            # The attempt may already be settled, in which case the abort is expected
+            try:
+                attempts = await get_attempts_bulk(self.client, [attempt_id])
+                completed = attempts[attempt_id].is_completed
+            except Exception as lookup_error:
+                print(f"❌ Checking attempt {attempt_id} failed: {lookup_error}")
+                completed = False
+            if completed:
+                self.journal.mark(attempt_id, CONFIRMED)
+            else:
+                print(f"❌ Settlement for attempt {attempt_id} failed: {e}")
+                await self._retry(attempt_id, status)
+        else:
+            self.journal.mark(attempt_id, CONFIRMED, receipt.hash)
+            print(f"   ✅ Attempt {attempt_id} settled ({'success' if status else 'failure'}): {receipt.hash}")
+        finally:
+            self.queue.task_done()
+
+    async def _retry(self, attempt_id: int, status: bool):
+        if self.journal.retries(attempt_id) >= self.max_retries:
+            self.journal.mark(attempt_id, FAILED)
+            return
+        self.journal.mark(attempt_id, QUEUED, retried=True)
+        self.queue.put_nowait((attempt_id, status))
+
+
+def parse_outcome(line: str) -> tuple[int, bool]:
+    """(attempt_id, status) from one JSON line: {"attempt_id": 1, "status": true}
+
+    Raises ValueError for anything else, including a status that is not a
+    JSON boolean, so "false" can never settle an attempt as a success.
+    """
+    outcome = json.loads(line)
+    if not isinstance(outcome, dict):
+        raise ValueError("expected a JSON object")
+    try:
+        attempt_id, status = outcome["attempt_id"], outcome["status"]
+    except KeyError as e:
+        raise ValueError(f"missing {e}") from None
+    if isinstance(attempt_id, bool) or not isinstance(attempt_id, (int, str)):
+        raise ValueError(f"attempt_id must be an integer, not {attempt_id!r}")
+    if not isinstance(status, bool):
+        raise ValueError(f"status must be true or false, not {status!r}")
+    return int(attempt_id), status
+
+
+async def read_outcomes(daemon: SettlementDaemon):
+    """Feed outcomes from stdin as JSON lines: {"attempt_id": 1, "status": true}"""
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            return
+        if not line.strip():
+            continue
+        try:
+            attempt_id, status = parse_outcome(line)
+        except ValueError as e:
+            print(f"❌ Bad outcome {line.strip()!r}: {e}")
+            continue
+        if not daemon.enqueue(attempt_id, status):
+            print(f"   Attempt {attempt_id} already journaled, skipping")
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Settlement Daemon")
+    print("=" * 40)
+
+    client = node_client()
+    await metrics.start()
+    journal = SettlementJournal()
+    oracle = load_oracle_account_from_env()
+    print(f"✅ Oracle account: {oracle.account_address}")
+    print(f"✅ Journal: {SETTLEMENT_JOURNAL} {journal.counts()}")
+
+    daemon = SettlementDaemon(client, oracle, journal)
+    try:
+        print(f"✅ Recovered {await daemon.recover()} unsettled outcomes")
+        worker = asyncio.create_task(daemon.run())
+        await read_outcomes(daemon)
+
+        # Input closed: finish the backlog, then stop
+        await daemon.wait_idle()
+        worker.cancel()
+        print(f"✅ Journal: {journal.counts()}")
+    finally:
+        journal.close()
+        await client.close()
+        await metrics.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Money Pot Startup Budget
+Runs the read-only CLI commands under -X importtime and fails when one
+imports a heavy dependency or exceeds the import time budget. What a bare
+interpreter imports at startup is left out of the budget.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "150"))
+STARTUP_RUNS = int(os.getenv("STARTUP_RUNS", "5"))
+
+# Modules the read-only commands must never load
+HEAVY_MODULES = ("aptos_sdk", "aiohttp", "cryptography", "httpx", "nacl")
+
+READ_COMMANDS = (["--help"], ["pots"], ["pots", "--ids"], ["pot", "1"])
+
+# Nothing listens here, so each command imports everything it needs and then
+# fails fast on its first request
+UNREACHABLE_NODE = "http://127.0.0.1:9/v1"
+
+
+def _importtime(args: list[str]) -> list[tuple[int, str]]:
+    """(self µs, module) for every import of one -X importtime run"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, "RPC_URL": UNREACHABLE_NODE},
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        imports.append((int(self_us), name.strip()))
+    return imports
+
+
+def measure(command: list[str], baseline: frozenset[str] = frozenset()) -> tuple[float, set[str]]:
+    """Import time in ms and the set of modules imported by one run, leaving out the baseline modules"""
+    total_us = 0
+    modules = set()
+    for self_us, name in _importtime(["cli.py", *command]):
+        if name not in baseline:
+            total_us += self_us
+            modules.add(name)
+    return total_us / 1000, modules
+
+
+def interpreter_baseline() -> frozenset[str]:
+    """Modules a bare interpreter imports at startup (site, .pth hooks), which no command can avoid"""
+    return frozenset(name for _, name in _importtime(["-c", "pass"]))
+
+
+def check(command: list[str], baseline: frozenset[str], runs: int = STARTUP_RUNS) -> tuple[float, list[str]]:
+    """Median import time in ms over several runs and any heavy modules they loaded"""
+    measure(command, baseline)  # Warm the bytecode cache
+    results = [measure(command, baseline) for _ in range(runs)]
+    median = statistics.median(total for total, _ in results)
+    heavy = sorted({
+        name.split(".")[0] for _, modules in results for name in modules
+        if name.split(".")[0] in HEAVY_MODULES
+    })
+    return median, heavy
+
+
+def main() -> int:
+    """Main entry point"""
+    print("Money Pot Startup Budget")
+    print("=" * 40)
+
+    baseline = interpreter_baseline()
+    failures = 0
+    print(f"   {'command':<18} {'median ms':>10} {'budget ms':>10}  heavy imports")
+    for command in READ_COMMANDS:
+        median, heavy = check(command, baseline)
+        ok = median <= STARTUP_BUDGET_MS and not heavy
+        failures += not ok
+        print(
+            f"{'✅' if ok else '❌'} {' '.join(command):<18} {median:>10.1f} "
+            f"{STARTUP_BUDGET_MS:>10.0f}  {', '.join(heavy) or '-'}"
+        )
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Money Pot Expiry Sweeper
+Keeps active pots in an expires_at min-heap and calls expire_pot as each one expires
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from typing import Dict
+
+from app import (
+    MODULE_QN,
+    Account,
+    AsyncRestClient,
+    TransactionSubmitter,
+    decode_pot_events,
+    expire_pot_payload,
+    get_active_pots_bulk,
+    get_pots_bulk,
+    load_main_account_from_env,
+    node_client,
+)
+from indexer import REGISTRY_ADDR, get_pot_events
+from metrics import metrics
+
+SWEEPER_MAX_IN_FLIGHT = int(os.getenv("SWEEPER_MAX_IN_FLIGHT", "16"))
+SWEEPER_GRACE_SECONDS = float(os.getenv("SWEEPER_GRACE_SECONDS", "2"))
+SWEEPER_EVENT_POLL_SECONDS = float(os.getenv("SWEEPER_EVENT_POLL_SECONDS", "2"))
+SWEEPER_MAX_FAILURES = int(os.getenv("SWEEPER_MAX_FAILURES", "3"))
+SWEEPER_MAX_BACKOFF_SECONDS = float(os.getenv("SWEEPER_MAX_BACKOFF_SECONDS", "60"))
+
+
+async def get_event_count(client: AsyncRestClient) -> int:
+    """Number of PotEvents emitted so far, from the registry's event handle"""
+    registry = await client.account_resource(REGISTRY_ADDR, f"{MODULE_QN}::Registry")
+    return int(registry["data"]["events"]["counter"])
+
+
+class ExpirySweeper:
+    """Expires pots exactly when they are due
+
+    Pots live in a min-heap of (expires_at, pot_id). Entries are dropped
+    lazily: one whose pot is no longer tracked with that expiry is skipped.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRestClient,
+        account: Account,
+        max_in_flight: int = SWEEPER_MAX_IN_FLIGHT,
+        grace_seconds: float = SWEEPER_GRACE_SECONDS,
+    ):
+        self.client = client
+        self.grace_seconds = grace_seconds
+        self.submitter = TransactionSubmitter(client, account, max_in_flight)
+        self.heap: list[tuple[int, int]] = []
+        self.expires_at: Dict[int, int] = {}
+        self.expired = 0
+        self._failures: Dict[int, int] = {}
+        self._changed = asyncio.Event()
+
+    def track(self, pot_id: int, expires_at: int):
+        """Schedule a pot, waking the sweep loop if it is now the earliest"""
+        if self.expires_at.get(pot_id) == expires_at:
+            return
+        self.expires_at[pot_id] = expires_at
+        heapq.heappush(self.heap, (expires_at, pot_id))
+        if self.heap[0] == (expires_at, pot_id):
+            self._changed.set()
+
+    def untrack(self, pot_id: int):
+        self.expires_at.pop(pot_id, None)
+
+    async def load_active_pots(self):
+        """Seed the heap from every active pot"""
+        for pot in (await get_active_pots_bulk(self.client)).values():
+            self.track(pot.id, pot.expires_at)
+
+    async def follow_events(self, start: int, page_size: int = 100):
+        """Track created pots and drop expired ones from the PotEvent stream
+
+        Node errors are logged and the page is read again after a backoff
+        that doubles up to SWEEPER_MAX_BACKOFF_SECONDS, so an outage never
+        stops the sweep loop.
+        """
+        backoff = SWEEPER_EVENT_POLL_SECONDS
+        while True:
+            try:
+                raw_events = await self._apply_events_page(start, page_size)
+            except Exception as e:
+                print(f"❌ Following pot events failed: {e}")
+                metrics.inc("sweeper_event_errors_total")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, SWEEPER_MAX_BACKOFF_SECONDS)
+                continue
+            backoff = SWEEPER_EVENT_POLL_SECONDS
+            if raw_events:
+                start = int(raw_events[-1]["sequence_number"]) + 1
+            if len(raw_events) < page_size:
+                await asyncio.sleep(SWEEPER_EVENT_POLL_SECONDS)
+
+    async def _apply_events_page(self, start: int, page_size: int) -> list:
+        """Apply one page of PotEvents; the caller only moves past it once this succeeds"""
+        raw_events = await get_pot_events(self.client, start, page_size)
+        events = decode_pot_events(raw_events)
+        created = [event.id for event in events if event.event_type == "created"]
+        for pot in (await get_pots_bulk(self.client, created)).values():
+            if pot.is_active:
+                self.track(pot.id, pot.expires_at)
+        for event in events:
+            if event.event_type == "expired":
+                self.untrack(event.id)
+        return raw_events
+
+    def _pop_due(self, now: float) -> list[int]:
+        due = []
+        while self.heap and self.heap[0][0] + self.grace_seconds <= now:
+            expires_at, pot_id = heapq.heappop(self.heap)
+            if self.expires_at.get(pot_id) == expires_at:
+                due.append(pot_id)
+        return due
+
+    async def run(self):
+        """Sleep until the next pot is due, then submit expire_pot for everything due"""
+        while True:
+            while self.heap and self.expires_at.get(self.heap[0][1]) != self.heap[0][0]:
+                heapq.heappop(self.heap)  # Stale entry
+
+            timeout = None
+            if self.heap:
+                timeout = max(0.0, self.heap[0][0] + self.grace_seconds - time.time())
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+                continue  # A new earliest pot arrived, recompute the deadline
+            except asyncio.TimeoutError:
+                pass
+
+            for pot_id in self._pop_due(time.time()):
+                try:
+                    future = await self.submitter.submit(expire_pot_payload(pot_id))
+                except Exception as e:
+                    print(f"❌ Submitting expire_pot for pot {pot_id} failed: {e}")
+                    self._reschedule(pot_id)
+                    continue
+                future.add_done_callback(lambda f, pot_id=pot_id: self._expired(pot_id, f))
+
+    def _reschedule(self, pot_id: int):
+        """Try a pot again after another grace period (e.g. chain time lagging ours)"""
+        self._failures[pot_id] = self._failures.get(pot_id, 0) + 1
+        self.expires_at.pop(pot_id, None)
+        if self._failures[pot_id] >= SWEEPER_MAX_FAILURES:
+            # Most likely expired by someone else; the event stream would have said so
+            print(f"❌ Giving up on pot {pot_id}")
+            return
+        self.track(pot_id, int(time.time() + self.grace_seconds))
+
+    def _expired(self, pot_id: int, future: asyncio.Future):
+        if future.exception() is not None:
+            print(f"❌ expire_pot for pot {pot_id} failed: {future.exception()}")
+            self._reschedule(pot_id)
+            return
+        if not future.result().success:
+            # Most likely expired by someone else first
+            print(f"❌ expire_pot for pot {pot_id} aborted: {future.result().vm_status}")
+            self._reschedule(pot_id)
+            return
+        self.untrack(pot_id)
+        self._failures.pop(pot_id, None)
+        self.expired += 1
+        print(f"   ✅ Pot {pot_id} expired: {future.result().hash}")
+
+
+async def main():
+    """Main entry point"""
+    print("Money Pot Expiry Sweeper")
+    print("=" * 40)
+
+    client = node_client()
+    await metrics.start()
+    account = load_main_account_from_env()
+    print(f"✅ Sweeper account: {account.account_address}")
+
+    sweeper = ExpirySweeper(client, account)
+    try:
+        # Read the event position first so pots created during the load aren't missed
+        start = await get_event_count(client)
+        await sweeper.load_active_pots()
+        print(f"✅ Tracking {len(sweeper.expires_at)} active pots")
+        await asyncio.gather(sweeper.run(), sweeper.follow_events(start))
+    finally:
+        await client.close()
+        await metrics.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+"""Startup budget of the read-only CLI commands, as checked by startup_check.py"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from startup_check import READ_COMMANDS, STARTUP_BUDGET_MS, check, interpreter_baseline  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return interpreter_baseline()
+
+
+@pytest.mark.parametrize("command", READ_COMMANDS, ids=" ".join)
+def test_read_command_startup(command, baseline):
+    median, heavy = check(command, baseline)
+    assert not heavy, f"{' '.join(command)} imported {', '.join(heavy)}"
+    assert median <= STARTUP_BUDGET_MS, f"{' '.join(command)} took {median:.1f} ms to import"